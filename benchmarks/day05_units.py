@@ -0,0 +1,135 @@
+"""Time and allocation profile of day05 range resolution on the real input.
+
+`Unit.Range` is measured next to `PropertyRange`, a mirror of its earlier
+unslotted form that computes `end` on every access, so the savings from
+slotting and precomputing `end` can be reproduced.
+
+Run from the repository root with ``python -m benchmarks.day05_units``.
+"""
+
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+
+from src.day05 import Category, Unit, load
+
+INPUT = Path(__file__).parent / "../src/day05/input.txt"
+
+
+@dataclass(frozen=True)
+class PropertyRange:
+    """`Unit.Range` as it was before slots: a plain frozen dataclass."""
+
+    category: Category
+    start: int
+    length: int
+
+    @property
+    def end(self):
+        return self.start + self.length
+
+    @property
+    def last(self):
+        return self.end - 1
+
+    def __contains__(self, item: int):
+        return item in range(self.start, self.end)
+
+    def split(self, other):
+        if not isinstance(other, PropertyRange):
+            raise TypeError()
+
+        if not self.category == other.category:
+            return [self]
+
+        if self.start in other:
+            if self.last in other:
+                return [self]
+            if self.last not in other:
+                return [
+                    PropertyRange(self.category, self.start, other.end - self.start),
+                    PropertyRange(self.category, other.end, self.end - other.end),
+                ]
+
+        if other.start in self:
+            if other.last in self:
+                overlap = other
+                remainder = [
+                    PropertyRange(self.category, self.start, other.start - self.start)
+                ]
+                if self.last > other.last:
+                    remainder.append(
+                        PropertyRange(self.category, other.end, self.end - other.end)
+                    )
+                return [overlap, *remainder]
+            if other.last not in self:
+                return [
+                    PropertyRange(self.category, other.start, self.end - other.start),
+                    PropertyRange(self.category, self.start, other.start - self.start),
+                ]
+
+        return [None, self]
+
+
+def resolve_all(almanac, seed_ranges):
+    return {*chain.from_iterable(almanac.resolve_range(r) for r in seed_ranges)}
+
+
+def allocated(build) -> int:
+    """Bytes still allocated by `build()` while its result is alive."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def compare(label: str, before: float, after: float, unit: str):
+    print(f"{label:<36}{before:>12.3f}{after:>12.3f} {unit:<4}{before / after:>8.2f}x")
+
+
+def main(number: int = 20):
+    (_, seed_ranges, almanac) = load(INPUT)
+
+    print(f"{'':<36}{'property':>12}{'slotted':>12}{'':<5}{'saving':>8}")
+    compare(
+        "100000 instances",
+        allocated(lambda: [PropertyRange(Category.SEED, n, 1) for n in range(100_000)])
+        / 1024,
+        allocated(lambda: [Unit.Range(Category.SEED, n, 1) for n in range(100_000)])
+        / 1024,
+        "KiB",
+    )
+
+    lines = almanac.maps[Category.SEED].lines
+    for cls in (PropertyRange, Unit.Range):
+        ranges = [cls(r.category, r.start, r.length) for r in seed_ranges]
+        line_ranges = [
+            cls(Category.SEED, line.source_range_start, line.range_length)
+            for line in lines
+        ]
+        splits = [(r, line) for r in ranges for line in line_ranges]
+        seconds = timeit.timeit(
+            lambda: [r.split(line) for r, line in splits], number=number
+        )
+        if cls is PropertyRange:
+            before = seconds
+    compare(
+        f"{len(splits)} splits", before / number * 1000, seconds / number * 1000, "ms"
+    )
+
+    tracemalloc.start()
+    resolve_all(almanac, seed_ranges)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\nresolve_range peak traced memory: {peak / 1024:.1f} KiB")
+
+    seconds = timeit.timeit(lambda: resolve_all(almanac, seed_ranges), number=number)
+    print(f"resolve_range over all seed ranges: {seconds / number * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
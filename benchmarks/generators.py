@@ -0,0 +1,139 @@
+"""Deterministic synthetic inputs, sized as multiples of each day's real input.
+
+Every generator takes a `scale` (1 for roughly the size of the real input) and
+a `seed`, and returns the text of an input file.
+"""
+
+from itertools import accumulate
+from math import isqrt
+from random import Random
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def day01(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    lines = []
+    for _ in range(1000 * scale):
+        tokens = [
+            random.choice(
+                [random.choice(WORDS), str(random.randint(1, 9)), random.choice("xyz")]
+            )
+            for _ in range(random.randint(2, 10))
+        ]
+        tokens.insert(random.randint(0, len(tokens)), str(random.randint(1, 9)))
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
+
+
+def day02(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    lines = []
+    for id in range(1, 100 * scale + 1):
+        drawings = []
+        for _ in range(random.randint(1, 6)):
+            colors = random.sample(["red", "green", "blue"], random.randint(1, 3))
+            drawings.append(", ".join(f"{random.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {id}: " + "; ".join(drawings))
+
+    return "\n".join(lines) + "\n"
+
+
+def day03(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    side = isqrt(140 * 140 * scale)
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            roll = random.random()
+            if roll < 0.08:
+                row.extend(str(random.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.12:
+                row.append(random.choice("*#+$/@=%&-"))
+            else:
+                row.append(".")
+        rows.append("".join(row[:side]))
+
+    return "\n".join(rows) + "\n"
+
+
+def day04(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    lines = []
+    for id in range(1, 211 * scale + 1):
+        winning = random.sample(range(1, 100), 10)
+        # Most cards match nothing, as in the real decks, so counts stay sane.
+        matches = random.choice([0, 0, 0, 0, 1, 1, 2, 3, 5, 10])
+        others = [n for n in range(1, 100) if n not in winning]
+        picks = random.sample(winning, matches) + random.sample(others, 25 - matches)
+        random.shuffle(picks)
+        lines.append(
+            f"Card {id:>3}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in picks)
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def day05(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    categories = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    seeds = []
+    for _ in range(10 * scale):
+        seeds += [random.randrange(2**32 - 2**28), random.randrange(1, 2**28)]
+    blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+
+    for source, destination in zip(categories, categories[1:]):
+        # Lay the source segments out again in shuffled order to get their
+        # destinations, then drop some lines to leave identity gaps.
+        cuts = sorted(random.sample(range(1, 2**32), 20 * scale))
+        segments = list(zip([0, *cuts], [*cuts, 2**32]))
+        shuffled = random.sample(segments, len(segments))
+        destination_starts = dict(
+            zip(
+                shuffled,
+                accumulate((end - start for start, end in shuffled), initial=0),
+            )
+        )
+        lines = [
+            f"{destination_starts[(start, end)]} {start} {end - start}"
+            for start, end in segments
+            if random.random() < 0.8
+        ]
+        blocks.append(f"{source}-to-{destination} map:\n" + "\n".join(lines))
+
+    return "\n\n".join(blocks) + "\n"
+
+
+def day06(scale: int, seed: int = 1) -> str:
+    random = Random(seed)
+    times = [random.randint(7, 100) for _ in range(4 * scale)]
+    records = [random.randint(0, (t // 2) * (t - t // 2) - 1) for t in times]
+    return (
+        "Time:     " + " ".join(f"{t:>4}" for t in times) + "\n"
+        "Distance: " + " ".join(f"{r:>4}" for r in records) + "\n"
+    )
+
+
+GENERATORS = {
+    "day01": day01,
+    "day02": day02,
+    "day03": day03,
+    "day04": day04,
+    "day05": day05,
+    "day06": day06,
+}
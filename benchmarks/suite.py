@@ -0,0 +1,157 @@
+"""Scaling benchmarks over synthetic inputs, checked against stored baselines.
+
+Each day is generated at several multiples of its real input size and run
+through the same stages as `python -m src.aoc`, plus a few targeted hot paths.
+Median wall times are compared with `baselines.json`; any stage slower than
+its baseline by more than the threshold fails the run, except stages too fast
+to time reliably. Baselines are machine-specific: refresh them with --save.
+
+    python -m benchmarks.suite [--days day03 day05] [--scales 1,10,100,1000]
+                               [--repeat 3] [--threshold 1.5] [--save]
+
+Targets listed in `MAX_SCALES` are impractical past their largest scale and
+are reported as skipped there, rather than timed. Everything else runs at
+every scale; day03 at 1000x takes a few minutes on its own.
+"""
+
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.generators import GENERATORS
+from src.aoc.runner import run, stages
+from src.day04 import process
+
+BASELINES = Path(__file__).parent / "baselines.json"
+INPUTS = Path(__file__).parent / ".inputs"
+
+# The largest scale each target is timed at, for targets that are impractical
+# beyond it. Stages and targets not listed here run at every scale.
+MAX_SCALES: dict[str, int] = {
+    # Seed ranges and map lines both grow with the scale, and each range
+    # fragments on every line it crosses, so the output alone is quadratic.
+    "Almanac.resolve_range": 100,
+}
+
+TARGETS: dict[str, list[tuple[str, Callable]]] = {
+    "day03": [("Schematic.part_numbers", lambda schematic: schematic.part_numbers)],
+    "day04": [("process", process)],
+    "day05": [
+        (
+            "Almanac.resolve_range",
+            lambda almanac_data: [
+                almanac_data[2].resolve_range(r) for r in almanac_data[1]
+            ],
+        )
+    ],
+}
+
+
+def generate(day: str, scale: int) -> Path:
+    """Write the day's input at `scale` once, reusing it on later runs.
+
+    Delete `benchmarks/.inputs` after changing a generator.
+    """
+    data_file = INPUTS / f"{day}-x{scale}.txt"
+    if not data_file.exists():
+        INPUTS.mkdir(exist_ok=True)
+        data_file.write_text(GENERATORS[day](scale))
+
+    return data_file
+
+
+def measure(day: str, scale: int, repeat: int) -> dict[str, float | None]:
+    """Median wall seconds of each stage and target, keyed like the baselines.
+
+    Targets skipped at this scale map to None.
+    """
+    data_file = generate(day, scale)
+    timings = {
+        f"{day}/x{scale}/{m.stage}": statistics.median(m.wall)
+        for m in run(day, data_file, repeat)
+    }
+
+    parse = stages(importlib.import_module(f"src.{day}"))[0][1]
+    for name, target in TARGETS.get(day, []):
+        if scale > MAX_SCALES.get(name, scale):
+            timings[f"{day}/x{scale}/{name}"] = None
+            continue
+        wall = []
+        for _ in range(repeat):
+            # Parse afresh each time, since the models cache their results.
+            parsed = parse(data_file)
+            start = time.perf_counter()
+            target(parsed)
+            wall.append(time.perf_counter() - start)
+        timings[f"{day}/x{scale}/{name}"] = statistics.median(wall)
+
+    return timings
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__
+    )
+    parser.add_argument("--days", nargs="*", default=list(GENERATORS))
+    parser.add_argument(
+        "--scales", default="1,10,100,1000", help="comma-separated multiples"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=1.5)
+    parser.add_argument(
+        "--floor-ms",
+        type=float,
+        default=5.0,
+        help="ignore regressions of stages whose baseline is faster than this",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="store results as baselines"
+    )
+    args = parser.parse_args(argv)
+
+    baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<40}{'median ms':>12}{'baseline ms':>14}{'ratio':>8}")
+    for day in args.days:
+        for scale in map(int, args.scales.split(",")):
+            for key, seconds in measure(day, scale, args.repeat).items():
+                if seconds is None:
+                    print(f"{key:<40}{'skipped':>12}")
+                    continue
+                results[key] = round(seconds, 6)
+                baseline = baselines.get(key)
+                ratio = seconds / baseline if baseline else None
+                print(
+                    f"{key:<40}{seconds * 1000:>12.3f}"
+                    f"{'' if baseline is None else f'{baseline * 1000:.3f}':>14}"
+                    f"{'' if ratio is None else f'{ratio:.2f}':>8}"
+                )
+                if (
+                    ratio is not None
+                    and ratio > args.threshold
+                    and baseline * 1000 >= args.floor_ms
+                ):
+                    regressions.append(key)
+
+    if args.save:
+        BASELINES.write_text(
+            json.dumps(baselines | results, indent=2, sort_keys=True) + "\n"
+        )
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} regressed past {args.threshold}x: {', '.join(regressions)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
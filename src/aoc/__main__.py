@@ -0,0 +1,3 @@
+from src.aoc.runner import main
+
+main()
@@ -0,0 +1,76 @@
+"""An on-disk cache of parsed inputs.
+
+Entries are pickles keyed on the input file's content hash, the loader, the
+loader's arguments, and the loader version. The version defaults to a hash of
+the loader module's source, so editing a day's parser invalidates its entries.
+The cache is capped in size and evicts least recently used entries first.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "advent-of-code-2023")
+)
+MAX_BYTES = 256 * 2**20
+
+
+def cached_load(
+    load: Callable,
+    data_file: Path,
+    *args,
+    version: str = None,
+    cache_dir: Path = CACHE_DIR,
+    max_bytes: int = MAX_BYTES,
+):
+    """Return `load(data_file, *args)`, from the cache when the input is unchanged."""
+    entry = Path(cache_dir) / f"{cache_key(load, data_file, args, version)}.pickle"
+    try:
+        with open(entry, "rb") as data:
+            parsed = pickle.load(data)
+        os.utime(entry)
+        return parsed
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+
+    parsed = load(data_file, *args)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    partial = entry.with_suffix(f".{os.getpid()}.partial")
+    with open(partial, "wb") as data:
+        pickle.dump(parsed, data, protocol=pickle.HIGHEST_PROTOCOL)
+    partial.replace(entry)
+    evict(cache_dir, max_bytes)
+
+    return parsed
+
+
+def cache_key(load: Callable, data_file: Path, args: tuple, version: str = None) -> str:
+    with open(data_file, "rb") as data:
+        key = hashlib.file_digest(data, "sha256")
+    key.update(f"{load.__module__}.{load.__qualname__}{args!r}".encode())
+    key.update((version or loader_version(load)).encode())
+
+    return key.hexdigest()
+
+
+def loader_version(load: Callable) -> str:
+    with open(sys.modules[load.__module__].__file__, "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+def evict(cache_dir: Path, max_bytes: int = MAX_BYTES):
+    """Delete least recently used entries until the cache fits in `max_bytes`."""
+    entries = sorted(
+        (entry.stat().st_mtime, entry.stat().st_size, entry)
+        for entry in Path(cache_dir).glob("*.pickle")
+    )
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in entries:
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
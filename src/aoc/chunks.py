@@ -0,0 +1,20 @@
+import os
+from pathlib import Path
+
+
+def line_offsets(data_file: Path, parts: int) -> list[int]:
+    """Split a file into about `parts` byte ranges that start on line starts.
+
+    Returns the boundaries, from 0 to the file size. Ranges never split a line,
+    so small files can yield fewer ranges than asked for.
+    """
+    size = os.path.getsize(data_file)
+    offsets = [0]
+    with open(data_file, "rb") as data:
+        for part in range(1, parts):
+            data.seek(max(size * part // parts - 1, offsets[-1]))
+            data.readline()
+            if offsets[-1] < data.tell() < size:
+                offsets.append(data.tell())
+
+    return offsets + [size]
@@ -0,0 +1,169 @@
+"""Opt-in counters for the hot paths of the day modules.
+
+Nothing is instrumented until a `Profiler` is entered: it swaps wrappers onto
+the target functions and puts the originals back on exit, so disabled
+profiling costs nothing at all. Each wrapped function records its call count,
+cumulative and inline time, its retained blocks, and how often each other
+wrapped function called it. Retained blocks are the net change in
+`sys.getallocatedblocks()` across its calls: the blocks they left alive, not
+a count of every allocation, since transient objects freed before a call
+returns cancel out. Generators are timed step by step, leaving out the
+consumer's work between steps. Results export as JSON, or as a stats file
+`pstats` can read.
+
+    with Profiler() as profiler:
+        solution_2(load(data_file))
+    profiler.dump_stats("day05.prof")
+"""
+
+import functools
+import importlib
+import inspect
+import json
+import marshal
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Self
+
+HOT_PATHS = (
+    "src.day01:calibration_value",
+    "src.day01:scan_buffer",
+    "src.day02:scan_game",
+    "src.day03:Grid.build",
+    "src.day03:Schematic.nearby_part_numbers",
+    "src.day04:card_counts",
+    "src.day05:Almanac.Map.__getitem__",
+    "src.day05:Almanac.Map.map_ranges",
+    "src.day05:Almanac.Map.sweep",
+    "src.day06:Race.kerned",
+    "src.day06:ways_to_win",
+)
+
+
+@dataclass
+class Stat:
+    calls: int = 0
+    cumulative: float = 0.0
+    inline: float = 0.0
+    retained_blocks: int = 0
+    callers: dict[str, int] = field(default_factory=dict)
+
+
+class Profiler:
+    def __init__(self, targets: tuple[str, ...] = HOT_PATHS):
+        self.targets = targets
+        self.stats: dict[str, Stat] = {target: Stat() for target in targets}
+        self._codes = {}
+        self._installed = []
+        self._stack = []
+
+    def __enter__(self) -> Self:
+        for target in self.targets:
+            owner, name = resolve(target)
+            original = vars(owner)[name]
+            function = getattr(original, "__func__", original)
+            self._codes[target] = function.__code__
+            wrapper = self._wrap(target, function)
+            if isinstance(original, staticmethod):
+                wrapper = staticmethod(wrapper)
+            setattr(owner, name, wrapper)
+            self._installed.append((owner, name, original))
+
+        return self
+
+    def __exit__(self, *exc_info):
+        while self._installed:
+            owner, name, original = self._installed.pop()
+            setattr(owner, name, original)
+
+    def _wrap(self, target: str, function):
+        stat = self.stats[target]
+        stack = self._stack
+
+        def called():
+            stat.calls += 1
+            if stack:
+                stat.callers[stack[-1][0]] = stat.callers.get(stack[-1][0], 0) + 1
+
+        def timed(step, *args, **kwargs):
+            frame = [target, 0.0]
+            stack.append(frame)
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            try:
+                return step(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stat.retained_blocks += sys.getallocatedblocks() - blocks
+                stack.pop()
+                stat.cumulative += elapsed
+                stat.inline += elapsed - frame[1]
+                if stack:
+                    stack[-1][1] += elapsed
+
+        if inspect.isgeneratorfunction(function):
+            # Time each step of the generator rather than its creation, so the
+            # consumer's work between steps is left out.
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                called()
+                generator = function(*args, **kwargs)
+                while True:
+                    try:
+                        item = timed(next, generator)
+                    except StopIteration as stop:
+                        return stop.value
+                    yield item
+
+        else:
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                called()
+                return timed(function, *args, **kwargs)
+
+        return wrapper
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {target: asdict(stat) for target, stat in self.stats.items() if stat.calls},
+            indent=2,
+        )
+
+    def dump_stats(self, path: Path):
+        """Write the counters in the marshalled format of `cProfile.Profile.dump_stats`."""
+
+        def key(target: str) -> tuple[str, int, str]:
+            code = self._codes[target]
+            return code.co_filename, code.co_firstlineno, target.partition(":")[2]
+
+        entries = {}
+        for target, stat in self.stats.items():
+            if not stat.calls:
+                continue
+            callers = {
+                key(caller): (calls, calls, 0.0, 0.0)
+                for caller, calls in stat.callers.items()
+            }
+            entries[key(target)] = (
+                stat.calls,
+                stat.calls,
+                stat.inline,
+                stat.cumulative,
+                callers,
+            )
+
+        with open(path, "wb") as stats_file:
+            marshal.dump(entries, stats_file)
+
+
+def resolve(target: str) -> tuple[object, str]:
+    module, _, qualname = target.partition(":")
+    owner = importlib.import_module(module)
+    *path, name = qualname.split(".")
+    for attribute in path:
+        owner = getattr(owner, attribute)
+
+    return owner, name
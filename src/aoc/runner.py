@@ -0,0 +1,167 @@
+"""Run day packages stage by stage and report where the time goes.
+
+Each day is run as `parse` (or `load`), `solution_1` and `solution_2`. Wall
+and CPU times come from untraced runs; peak memory comes from one extra run
+under tracemalloc, so tracing does not skew the timings.
+
+With `--cache`, the parse stage reads from the on-disk cache in `src.aoc.cache`
+whenever the input is unchanged, so it times unpickling rather than parsing.
+
+With `--profile PATH`, the hot paths listed in `src.aoc.profiling` are counted
+across the whole run and written to PATH, as JSON when it ends in `.json` and
+as `pstats` data otherwise.
+
+    python -m src.aoc [day01 day05 ...] [--input PATH] [--repeat N] [--cache]
+                      [--profile PATH]
+"""
+
+import argparse
+import importlib
+import pkgutil
+import re
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+
+from src.aoc.cache import cached_load
+from src.aoc.profiling import Profiler
+
+SRC = Path(__file__).parent.parent
+
+
+@dataclass
+class Measurement:
+    stage: str
+    answer: object = None
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    peak: int = 0
+
+    @property
+    def formatted_answer(self) -> str:
+        try:
+            return "" if self.answer is None else str(self.answer)
+        except ValueError:
+            # Ints past the interpreter's int/str conversion limit.
+            return f"{self.answer.bit_length()}-bit int"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.stage:<12}"
+            f"{self.formatted_answer:>16}"
+            f"{min(self.wall) * 1000:>12.3f}{statistics.median(self.wall) * 1000:>12.3f}"
+            f"{min(self.cpu) * 1000:>12.3f}{statistics.median(self.cpu) * 1000:>12.3f}"
+            f"{self.peak / 1024:>12.1f}"
+        )
+
+
+HEADER = (
+    f"{'stage':<12}{'answer':>16}{'wall best':>12}{'wall median':>12}"
+    f"{'cpu best':>12}{'cpu median':>12}{'peak KiB':>12}"
+)
+
+
+def discover() -> list[str]:
+    return sorted(
+        m.name
+        for m in pkgutil.iter_modules([str(SRC)])
+        if re.fullmatch(r"day\d\d", m.name)
+    )
+
+
+def stages(module: ModuleType, cached: bool = False) -> list[tuple[str, Callable]]:
+    parse = getattr(module, "parse", module.load)
+    return [
+        ("parse", partial(cached_load, parse) if cached else parse),
+        ("solution_1", module.solution_1),
+        ("solution_2", module.solution_2),
+    ]
+
+
+def run(
+    day: str, data_file: Path, repeat: int = 1, cached: bool = False
+) -> list[Measurement]:
+    module = importlib.import_module(f"src.{day}")
+    day_stages = stages(module, cached)
+    measurements = [Measurement(name) for name, _ in day_stages]
+    for _ in range(repeat):
+        _run_once(day_stages, data_file, measurements, traced=False)
+
+    tracemalloc.start()
+    try:
+        _run_once(day_stages, data_file, measurements, traced=True)
+    finally:
+        tracemalloc.stop()
+
+    return measurements
+
+
+def _run_once(
+    day_stages: list[tuple[str, Callable]],
+    data_file: Path,
+    measurements: list[Measurement],
+    traced: bool,
+):
+    # Every run parses afresh, since the models cache solutions on themselves.
+    parsed = data_file
+    for (name, stage), measurement in zip(day_stages, measurements):
+        argument = data_file if name == "parse" else parsed
+        if traced:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            result = stage(argument)
+            measurement.peak = tracemalloc.get_traced_memory()[1] - baseline
+        else:
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = stage(argument)
+            measurement.wall.append(time.perf_counter() - wall)
+            measurement.cpu.append(time.process_time() - cpu)
+
+        if name == "parse":
+            parsed = result
+        else:
+            measurement.answer = result
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="python -m src.aoc", description=__doc__)
+    parser.add_argument("days", nargs="*", help="days to run, such as day05")
+    parser.add_argument("--input", type=Path, help="input file for a single day")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per day")
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse parsed inputs across runs"
+    )
+    parser.add_argument("--profile", type=Path, help="write hot path counters here")
+    args = parser.parse_args(argv)
+
+    available = discover()
+    days = args.days or available
+    for day in days:
+        if day not in available:
+            parser.error(f"unknown day '{day}', expected one of {', '.join(available)}")
+    if args.input and len(days) != 1:
+        parser.error("--input needs exactly one day")
+
+    profiler = Profiler()
+    with profiler if args.profile else nullcontext():
+        for day in days:
+            data_file = args.input or SRC / day / "input.txt"
+            print(f"{day} ({data_file}, {args.repeat} runs, times in ms)")
+            if data_file.stat().st_size == 0:
+                print("  no input\n")
+                continue
+            print(f"  {HEADER}")
+            for measurement in run(day, data_file, args.repeat, args.cache):
+                print(f"  {measurement}")
+            print()
+
+    if args.profile and args.profile.suffix == ".json":
+        args.profile.write_text(profiler.to_json())
+    elif args.profile:
+        profiler.dump_stats(args.profile)
@@ -1,6 +1,13 @@
+import mmap
+import os
 import re
-from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from functools import cache
+from pathlib import Path
+
+from src.aoc.chunks import line_offsets
 
 
 DIGIT_MAP = {
@@ -25,6 +32,8 @@ DIGIT_MAP = {
     "nine": 9,
 }
 
+BYTES_DIGIT_MAP = {k.encode(): v for k, v in DIGIT_MAP.items()}
+
 
 class Strategy(Enum):
     DIGITS_ONLY = r"(?=(\d))"
@@ -36,11 +45,122 @@ def load(data_file: Path, strategy: Strategy = Strategy.DIGITS_ONLY):
 
     with open(data_file) as calibration_data:
         for line in calibration_data:
-            digits = parse_digits(line, strategy)
-            calibration_values.append(digits[0] * 10 + digits[-1])
+            calibration_values.append(calibration_value(line, strategy))
 
     return calibration_values
 
 
 def parse_digits(line: str, strategy: Strategy):
     return list(map(lambda s: DIGIT_MAP[s], re.findall(strategy.value, line)))
+
+
+def parse(data_file: Path) -> list[str]:
+    with open(data_file) as calibration_data:
+        return list(calibration_data)
+
+
+def solution_1(lines: list[str]) -> int:
+    return sum(calibration_value(line, Strategy.DIGITS_ONLY) for line in lines)
+
+
+def solution_2(lines: list[str]) -> int:
+    return sum(calibration_value(line, Strategy.DIGITS_OR_WORDS) for line in lines)
+
+
+def calibration_value(line: str, strategy: Strategy) -> int:
+    return first_digit(line, strategy) * 10 + last_digit(line, strategy)
+
+
+def first_digit(line: str, strategy: Strategy) -> int:
+    if not (match := forward_pattern(strategy).search(line)):
+        raise ValueError(f"no calibration digit in '{line.rstrip()}'")
+    return DIGIT_MAP[match.group(1)]
+
+
+def last_digit(line: str, strategy: Strategy) -> int:
+    return DIGIT_MAP[backward_pattern(strategy).search(line[::-1]).group()[::-1]]
+
+
+@cache
+def forward_pattern(strategy: Strategy) -> re.Pattern:
+    return re.compile(strategy.value)
+
+
+@cache
+def backward_pattern(strategy: Strategy) -> re.Pattern:
+    """Match the strategy's digits spelled backwards, to scan a reversed line."""
+    tokens = [
+        k for k in DIGIT_MAP if (m := re.match(strategy.value, k)) and m.group(1) == k
+    ]
+    return re.compile("|".join(re.escape(token[::-1]) for token in tokens))
+
+
+def total(data_file: Path, strategy: Strategy = Strategy.DIGITS_ONLY) -> int:
+    """Sum the calibration values of a file without building a list."""
+    return sum(scan(data_file, strategy))
+
+
+def parallel_total(
+    data_file: Path,
+    strategy: Strategy = Strategy.DIGITS_ONLY,
+    chunks: int = None,
+    max_workers: int = None,
+) -> int:
+    """Sum the calibration values of a file in newline-aligned chunks across processes."""
+    offsets = line_offsets(data_file, chunks or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        return sum(
+            executor.map(
+                _chunk_total,
+                [data_file] * (len(offsets) - 1),
+                [strategy] * (len(offsets) - 1),
+                offsets[:-1],
+                offsets[1:],
+            )
+        )
+
+
+def _chunk_total(data_file: Path, strategy: Strategy, start: int, end: int) -> int:
+    if start == end:
+        return 0
+    with open(data_file, "rb") as data:
+        with mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return sum(scan_buffer(buffer, strategy, start, end))
+
+
+def scan(data_file: Path, strategy: Strategy = Strategy.DIGITS_ONLY) -> Iterator[int]:
+    """Yield each line's calibration value, scanning a memory map of raw bytes."""
+    with open(data_file, "rb") as data:
+        if data.seek(0, 2) == 0:
+            return
+        with mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from scan_buffer(buffer, strategy)
+
+
+def scan_buffer(
+    buffer, strategy: Strategy, start: int = 0, end: int = None
+) -> Iterator[int]:
+    """Yield the calibration values of the lines in `buffer[start:end]`.
+
+    Like `calibration_value`, a line without a digit raises `ValueError`. The
+    last digit comes from a greedy match that backtracks from the end of the
+    line.
+    """
+    end = len(buffer) if end is None else end
+    forward, backward = bytes_patterns(strategy)
+    while start < end:
+        line_end = buffer.find(b"\n", start, end)
+        line_end = end if line_end < 0 else line_end
+        if not (first := forward.search(buffer, start, line_end)):
+            line = bytes(buffer[start:line_end]).decode().rstrip()
+            raise ValueError(f"no calibration digit in '{line}'")
+        last = backward.match(buffer, start, line_end)
+        yield BYTES_DIGIT_MAP[first.group(1)] * 10 + BYTES_DIGIT_MAP[last.group(1)]
+        start = line_end + 1
+
+
+@cache
+def bytes_patterns(strategy: Strategy) -> tuple[re.Pattern, re.Pattern]:
+    pattern = strategy.value.encode()
+    return re.compile(pattern), re.compile(b".*" + pattern)
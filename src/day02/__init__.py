@@ -1,4 +1,6 @@
 import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Self
@@ -13,6 +15,27 @@ def load(data_file: Path):
     return games
 
 
+def solution_1(games: list["Game"]) -> int:
+    bag = Bag(red=12, green=13, blue=14)
+    return sum(game.id for game in games if game.is_possible(bag))
+
+
+def solution_2(games: list["Game"]) -> int:
+    return sum(game.smallest_possible_bag.power for game in games)
+
+
+def load_columns(data_file: Path) -> "GameColumns":
+    return GameColumns.from_bags(scan(data_file))
+
+
+def scan(data_file: Path) -> Iterator[tuple[int, "Bag"]]:
+    """Yield each game's id and smallest possible bag, parsing raw bytes."""
+    with open(data_file, "rb") as lines:
+        for game_data in lines:
+            if game_data.strip():
+                yield scan_game(game_data)
+
+
 @dataclass
 class Bag:
     blue: int = 0
@@ -48,9 +71,8 @@ class Game:
 
     @staticmethod
     def from_str(game_data: str) -> Self:
-        (id_data, drawings_data) = game_data.split(":")
-        id = int(re.search(r"Game (\d+)", id_data).group(1))
-        drawings = [Drawing.from_str(d) for d in drawings_data.split(";")]
+        drawings = []
+        id, _ = scan_game(game_data, drawings)
         return Game(id, drawings)
 
     @property
@@ -63,3 +85,146 @@ class Game:
 
     def is_possible(self, bag: Bag) -> bool:
         return all(d.is_possible(bag) for d in self.drawings)
+
+
+SEPARATORS = {str: (":", ";", ","), bytes: (b":", b";", b",")}
+
+# Position of each color in the `Drawing` and `Bag` fields (blue, green, red).
+COLORS = {"blue": 0, "green": 1, "red": 2, b"blue": 0, b"green": 1, b"red": 2}
+
+
+def scan_game(
+    game_data: str | bytes, drawings: list[Drawing] = None
+) -> tuple[int, Bag]:
+    """Split a game line into its id and smallest possible bag.
+
+    Each drawing is also appended to `drawings` when a list is given.
+    """
+    colon, semicolon, comma = SEPARATORS[type(game_data)]
+    id_data, drawings_data = game_data.split(colon)
+    rows = []
+    for drawing_data in drawings_data.split(semicolon):
+        counts = [0, 0, 0]
+        for cube_data in drawing_data.split(comma):
+            count, color = cube_data.split()
+            counts[COLORS[color]] = int(count)
+        rows.append(counts)
+
+    if drawings is not None:
+        drawings.extend(Drawing(*counts) for counts in rows)
+
+    return int(id_data.split()[1]), Bag(*map(max, zip(*rows)))
+
+
+@dataclass
+class BagIndex:
+    """Sums of game ids as a cumulative table over smallest bags.
+
+    The axes hold the distinct red, green and blue counts of the smallest
+    bags, so the table grows with the games rather than with the counts.
+    `table[r][g][b]` holds the sum of the ids of the games whose smallest bag
+    fits in the bag of `reds[r]`, `greens[g]` and `blues[b]` cubes, and each
+    query bisects into the axes for one lookup.
+    """
+
+    reds: list[int]
+    greens: list[int]
+    blues: list[int]
+    table: list[list[list[int]]]
+
+    @staticmethod
+    def build(games: list[Game]) -> Self:
+        bags = [(g.id, g.smallest_possible_bag) for g in games]
+        reds, greens, blues = (
+            sorted({getattr(b, color) for _, b in bags})
+            for color in ("red", "green", "blue")
+        )
+        red_index, green_index, blue_index = (
+            {count: i for i, count in enumerate(axis)} for axis in (reds, greens, blues)
+        )
+        table = [[[0] * len(blues) for _ in greens] for _ in reds]
+        for id, bag in bags:
+            table[red_index[bag.red]][green_index[bag.green]][
+                blue_index[bag.blue]
+            ] += id
+
+        for plane in table:
+            for row in plane:
+                for b in range(1, len(blues)):
+                    row[b] += row[b - 1]
+            for g in range(1, len(greens)):
+                for b in range(len(blues)):
+                    plane[g][b] += plane[g - 1][b]
+        for r in range(1, len(reds)):
+            for g in range(len(greens)):
+                for b in range(len(blues)):
+                    table[r][g][b] += table[r - 1][g][b]
+
+        return BagIndex(reds, greens, blues, table)
+
+    def possible_id_sum(self, bag: Bag) -> int:
+        r = bisect_right(self.reds, bag.red) - 1
+        g = bisect_right(self.greens, bag.green) - 1
+        b = bisect_right(self.blues, bag.blue) - 1
+        if min(r, g, b) < 0:
+            return 0
+        return self.table[r][g][b]
+
+    def possible_id_sums(self, bags: Iterable[Bag]) -> list[int]:
+        return [self.possible_id_sum(bag) for bag in bags]
+
+
+@dataclass
+class GameColumns:
+    """Per-game ids and smallest bags as NumPy columns, for batch queries.
+
+    Requires the optional numpy dependency.
+    """
+
+    ids: "numpy.ndarray"
+    red: "numpy.ndarray"
+    green: "numpy.ndarray"
+    blue: "numpy.ndarray"
+
+    @staticmethod
+    def from_games(games: list[Game]) -> Self:
+        return GameColumns.from_bags((g.id, g.smallest_possible_bag) for g in games)
+
+    @staticmethod
+    def from_bags(bags: Iterable[tuple[int, Bag]]) -> Self:
+        import numpy as np
+
+        ids, red, green, blue = [], [], [], []
+        for id, bag in bags:
+            ids.append(id)
+            red.append(bag.red)
+            green.append(bag.green)
+            blue.append(bag.blue)
+
+        return GameColumns(
+            ids=np.array(ids, dtype=np.int64),
+            red=np.array(red, dtype=np.int64),
+            green=np.array(green, dtype=np.int64),
+            blue=np.array(blue, dtype=np.int64),
+        )
+
+    def is_possible(self, bag: Bag) -> "numpy.ndarray":
+        return (
+            (self.red <= bag.red) & (self.green <= bag.green) & (self.blue <= bag.blue)
+        )
+
+    def possible_id_sums(self, bags: list[Bag]) -> "numpy.ndarray":
+        """Sum the ids of the games possible for each bag, as one matrix product."""
+        import numpy as np
+
+        limits = np.array([(b.red, b.green, b.blue) for b in bags], dtype=np.int64)
+        possible = (
+            (self.red <= limits[:, 0:1])
+            & (self.green <= limits[:, 1:2])
+            & (self.blue <= limits[:, 2:3])
+        )
+        return possible.astype(np.int64) @ self.ids
+
+    @property
+    def power_sum(self) -> int:
+        return int((self.red * self.green * self.blue).sum())
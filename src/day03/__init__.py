@@ -1,11 +1,19 @@
+import os
 import re
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from functools import cached_property
-from itertools import chain
+from itertools import accumulate, chain
 from math import prod
+from operator import attrgetter
 from pathlib import Path
-from typing import Self
+from typing import BinaryIO, Self
+
+from src.aoc.chunks import line_offsets
+
+CHUNK_SIZE = 2**16
 
 
 @dataclass(frozen=True)
@@ -14,6 +22,9 @@ class Coordinate:
     y: int
 
 
+ORIGIN = Coordinate(0, 0)
+
+
 @dataclass(frozen=True)
 class Extent:
     top_left: Coordinate
@@ -43,6 +54,16 @@ class Extent:
             self.bottom_right.y - self.top_left.y + 1
         )
 
+    def rows(self, width: int, origin: Coordinate = ORIGIN) -> Iterator[range]:
+        """Yield each row as a range of packed `y * width + x` offsets from `origin`."""
+        left = self.top_left.x - origin.x
+        right = self.bottom_right.x - origin.x
+        for y in range(self.top_left.y - origin.y, self.bottom_right.y - origin.y + 1):
+            yield range(y * width + left, y * width + right + 1)
+
+    def offsets(self, width: int, origin: Coordinate = ORIGIN) -> Iterator[int]:
+        return chain.from_iterable(self.rows(width, origin))
+
 
 @dataclass(frozen=True)
 class Neighborhood:
@@ -84,6 +105,21 @@ class Neighborhood:
     def __len__(self) -> int:
         return len(self.outer) - len(self.inner)
 
+    def rows(self, width: int, origin: Coordinate = ORIGIN) -> Iterator[range]:
+        """Yield runs of packed `y * width + x` offsets from `origin`, row by row."""
+        left = self.inner.top_left.x - 1 - origin.x
+        right = self.inner.bottom_right.x + 1 - origin.x
+        top = self.inner.top_left.y - 1 - origin.y
+        bottom = self.inner.bottom_right.y + 1 - origin.y
+        yield range(top * width + left, top * width + right + 1)
+        for y in range(top + 1, bottom):
+            yield range(y * width + left, y * width + left + 1)
+            yield range(y * width + right, y * width + right + 1)
+        yield range(bottom * width + left, bottom * width + right + 1)
+
+    def offsets(self, width: int, origin: Coordinate = ORIGIN) -> Iterator[int]:
+        return chain.from_iterable(self.rows(width, origin))
+
 
 @dataclass(frozen=True)
 class Symbol:
@@ -108,24 +144,115 @@ class Number:
         )
 
 
+@dataclass(frozen=True)
+class Grid:
+    """A dense, row-major view of a schematic, padded by one cell per side.
+
+    `symbols` flags each cell holding a symbol and `labels` holds the index in
+    `numbers` of the number covering each cell, or -1.
+    """
+
+    origin: Coordinate
+    width: int
+    symbols: bytearray
+    labels: array
+    numbers: list[Number]
+
+    @staticmethod
+    def build(extent: Extent, symbols: set[Symbol], numbers: set[Number]) -> Self:
+        outer = extent.neighborhood.outer
+        width = outer.bottom_right.x - outer.top_left.x + 1
+        size = width * (outer.bottom_right.y - outer.top_left.y + 1)
+        grid = Grid(
+            origin=outer.top_left,
+            width=width,
+            symbols=bytearray(size),
+            labels=array("l", [-1]) * size,
+            numbers=sorted(numbers, key=lambda n: (n.location.y, n.location.x)),
+        )
+        for s in symbols:
+            grid.symbols[grid.offset(s.location)] = 1
+        for label, n in enumerate(grid.numbers):
+            for i in n.extent.offsets(grid.width, grid.origin):
+                grid.labels[i] = label
+
+        return grid
+
+    def offset(self, coordinate: Coordinate) -> int:
+        return (coordinate.y - self.origin.y) * self.width + (
+            coordinate.x - self.origin.x
+        )
+
+    def is_part_number(self, number: Number) -> bool:
+        start = self.offset(number.location) - 1
+        end = start + len(number.value) + 2
+        return (
+            self.symbols.find(1, start - self.width, end - self.width) >= 0
+            or self.symbols[start] == 1
+            or self.symbols[end - 1] == 1
+            or self.symbols.find(1, start + self.width, end + self.width) >= 0
+        )
+
+    def labels_around(self, coordinate: Coordinate) -> set[int]:
+        labels = self.labels
+        return {
+            labels[i]
+            for i in Extent(coordinate, coordinate).neighborhood.offsets(
+                self.width, self.origin
+            )
+            if labels[i] >= 0
+        }
+
+
+@dataclass(frozen=True, eq=False)
+class CoordinateMapping(Mapping[Coordinate, Number]):
+    """A coordinate-keyed view of values keyed by packed grid offsets.
+
+    Coordinates are only created when the mapping is iterated.
+    """
+
+    grid: Grid
+    by_offset: dict[int, Number]
+
+    def __getitem__(self, coordinate: Coordinate) -> Number:
+        x = coordinate.x - self.grid.origin.x
+        if not 0 <= x < self.grid.width:
+            raise KeyError(coordinate)
+        return self.by_offset[self.grid.offset(coordinate)]
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        for i in self.by_offset:
+            y, x = divmod(i, self.grid.width)
+            yield Coordinate(x + self.grid.origin.x, y + self.grid.origin.y)
+
+    def __len__(self) -> int:
+        return len(self.by_offset)
+
+
 @dataclass
 class Schematic:
     extent: Extent
     symbols: set[Symbol] = field(default_factory=set)
     numbers: set[Number] = field(default_factory=set)
 
+    @cached_property
+    def grid(self) -> Grid:
+        return Grid.build(self.extent, self.symbols, self.numbers)
+
     @cached_property
     def part_numbers(self) -> set[Number]:
-        symbol_locations = {s.location for s in self.symbols}
-        return {
-            n
-            for n in self.numbers
-            if any(map(lambda c: c in symbol_locations, n.extent.neighborhood))
-        }
+        return {n for n in self.numbers if self.grid.is_part_number(n)}
 
     @cached_property
-    def part_numbers_by_extent_coordinates(self) -> dict[Coordinate, Number]:
-        return dict((c, n) for n in self.part_numbers for c in n.extent)
+    def part_numbers_by_extent_coordinates(self) -> Mapping[Coordinate, Number]:
+        return CoordinateMapping(
+            self.grid,
+            {
+                i: n
+                for n in self.part_numbers
+                for i in n.extent.offsets(self.grid.width, self.grid.origin)
+            },
+        )
 
     @cached_property
     def gears(self) -> set[Symbol]:
@@ -143,16 +270,290 @@ class Schematic:
         )
 
     def nearby_part_numbers(self, symbol: Symbol) -> set[Number]:
+        # Any number next to a symbol is a part number by definition.
+        return {self.grid.numbers[i] for i in self.grid.labels_around(symbol.location)}
+
+
+def vectorized_sums(schematic: Schematic) -> tuple[int, int]:
+    """Sum the part numbers and gear ratios with array operations only.
+
+    The numbers and symbols are read out of the schematic once and written
+    into a byte raster, which `raster_sums` reduces. Reading out the
+    dataclasses dominates on large grids; `vectorized_file_sums` skips it.
+    Requires the optional numpy dependency.
+    """
+    import numpy as np
+
+    outer = schematic.extent.neighborhood.outer
+    width = outer.bottom_right.x - outer.top_left.x + 1
+    shape = (outer.bottom_right.y - outer.top_left.y + 1, width)
+    cells = np.full(shape[0] * shape[1], ord("."), dtype=np.uint8)
+
+    def write(items: Iterable):
+        items = list(items)
+        text = "".join(map(attrgetter("value"), items)).encode()
+        lengths = np.fromiter(
+            map(len, map(attrgetter("value"), items)), dtype=np.int64, count=len(items)
+        )
+        locations = np.fromiter(
+            chain.from_iterable(map(attrgetter("location.y", "location.x"), items)),
+            dtype=np.int64,
+            count=2 * len(items),
+        ).reshape(-1, 2)
+        starts = (locations[:, 0] - outer.top_left.y) * width + (
+            locations[:, 1] - outer.top_left.x
+        )
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        cells[shifts + np.arange(len(text))] = np.frombuffer(text, dtype=np.uint8)
+
+    write(schematic.numbers)
+    write(schematic.symbols)
+    return raster_sums(cells.reshape(shape))
+
+
+def vectorized_file_sums(data_file: Path) -> tuple[int, int]:
+    """Sum the part numbers and gear ratios of a file without a `Schematic`.
+
+    The file's bytes are padded into a raster directly, so no Python code runs
+    per number, symbol or cell. Requires the optional numpy dependency.
+    """
+    import numpy as np
+
+    rows = data_file.read_bytes().splitlines()
+    # One column of padding after every row also pads the start of the next.
+    width = max(map(len, rows), default=0) + 1
+    padding = b"." * width
+    cells = np.frombuffer(
+        b"".join([padding, *(row.ljust(width, b".") for row in rows), padding]),
+        dtype=np.uint8,
+    )
+    return raster_sums(cells.reshape(-1, width))
+
+
+def raster_sums(cells: "numpy.ndarray") -> tuple[int, int]:
+    """Sum the part numbers and gear ratios of a two-dimensional byte raster.
+
+    The raster must not have digits or symbols in its last column, nor in its
+    first and last rows, so that no digit run or neighborhood wraps around.
+    """
+    import numpy as np
+
+    width = cells.shape[1]
+    flat = cells.ravel()
+    digits = (flat >= ord("0")) & (flat <= ord("9"))
+    run_starts = digits.copy()
+    run_starts[1:] &= ~digits[:-1]
+    labels = np.where(digits, np.cumsum(run_starts) - 1, -1)
+
+    # Each run's digits are weighted by their place and summed per run, in
+    # the same row-major order as the labels. Numbers too long for int64 fall
+    # back to Python ints, which also keep the sums and products below exact.
+    digit_cells = np.flatnonzero(digits)
+    firsts = np.flatnonzero(run_starts[digit_cells])
+    lengths = np.diff(firsts, append=len(digit_cells))
+    places = np.repeat(firsts + lengths, lengths) - np.arange(len(digit_cells)) - 1
+    if lengths.max(initial=0) <= 18:
+        place_values = 10**places
+        dtype = np.int64
+    else:
+        place_values = 10 ** places.astype(object)
+        dtype = object
+    values = (flat[digit_cells] - ord("0")).astype(dtype) * place_values
+    values = np.add.reduceat(values, firsts) if len(firsts) else values
+    values = np.append(values, 0)
+
+    symbols = (
+        ~digits & (flat > ord(" ")) & (flat != ord(".")) & (flat != ord("\\"))
+    ).reshape(cells.shape)
+    near_symbol = symbols.copy()
+    near_symbol[1:] |= symbols[:-1]
+    near_symbol[:-1] |= symbols[1:]
+    near_symbol[:, 1:] |= near_symbol[:, :-1].copy()
+    near_symbol[:, :-1] |= near_symbol[:, 1:].copy()
+    part_labels = np.unique(labels[near_symbol.ravel() & digits])
+    part_number_sum = int(values[part_labels].sum(dtype=object))
+
+    around = np.array([dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+    stars = np.flatnonzero(flat == ord("*"))
+    nearby = np.sort(labels[stars.reshape(-1, 1) + around], axis=1)
+    distinct = nearby >= 0
+    distinct[:, 1:] &= nearby[:, 1:] != nearby[:, :-1]
+    gears = distinct.sum(axis=1) >= 2
+    nearby, distinct = nearby[gears], distinct[gears]
+    ratios = np.where(distinct, values[nearby].astype(object), 1).prod(axis=1)
+    gear_ratio_sum = int(ratios.sum(initial=0))
+
+    return part_number_sum, gear_ratio_sum
+
+
+@dataclass(frozen=True)
+class Row:
+    symbols: list[Symbol]
+    numbers: list[Number]
+
+    @staticmethod
+    def parse(y: int, line: str) -> Self:
+        return Row(
+            symbols=[
+                Symbol(value=m.group(), location=Coordinate(m.start(), y))
+                for m in re.finditer(r"(?![\d\\.]).", line.strip())
+            ],
+            numbers=[
+                Number(value=m.group(), location=Coordinate(m.start(), y))
+                for m in re.finditer(r"\d+", line.strip())
+            ],
+        )
+
+    @cached_property
+    def symbol_xs(self) -> set[int]:
+        return {s.location.x for s in self.symbols}
+
+    @cached_property
+    def numbers_by_x(self) -> dict[int, Number]:
         return {
-            self.part_numbers_by_extent_coordinates[c]
-            for c in symbol.neighborhood
-            if c in self.part_numbers_by_extent_coordinates
+            x: n
+            for n in self.numbers
+            for x in range(n.location.x, n.location.x + len(n.value))
+        }
+
+    def solve(self, above: Self, below: Self) -> tuple[set[Number], dict[Symbol, int]]:
+        rows = (above, self, below)
+        part_numbers = {
+            n
+            for n in self.numbers
+            if any(
+                x in r.symbol_xs
+                for r in rows
+                for x in range(n.location.x - 1, n.location.x + len(n.value) + 1)
+            )
         }
+        gear_ratios_by_gear = {}
+        for s in self.symbols:
+            if s.value != "*":
+                continue
+            nearby_numbers = {
+                r.numbers_by_x[x]
+                for r in rows
+                for x in range(s.location.x - 1, s.location.x + 2)
+                if x in r.numbers_by_x
+            }
+            if len(nearby_numbers) >= 2:
+                gear_ratios_by_gear[s] = prod(int(n.value) for n in nearby_numbers)
+
+        return part_numbers, gear_ratios_by_gear
+
+
+def stream(
+    lines: Iterable[str], first_y: int = 0
+) -> Iterator[tuple[set[Number], dict[Symbol, int]]]:
+    """Solve a schematic row by row, holding only three rows at a time.
+
+    Yields the part numbers and gear ratios of each row as soon as the row
+    below it has been read. `lines` can be any iterable, such as `sys.stdin`.
+    """
+    empty = Row.parse(first_y - 1, "")
+    above, current = empty, None
+    for y, line in enumerate(lines, start=first_y):
+        below = Row.parse(y, line)
+        if current is not None:
+            yield current.solve(above, below)
+            above = current
+        current = below
+
+    if current is not None:
+        yield current.solve(above, empty)
+
+
+def solve_parallel(
+    data_file: Path, bands: int = None, max_workers: int = None
+) -> tuple[set[Number], dict[Symbol, int]]:
+    """Solve a schematic in horizontal bands across worker processes.
+
+    Bands are byte ranges aligned to line starts. Workers first count the
+    lines in each band to place it, then solve it with one halo row read from
+    each neighbouring band. Each row is solved only by the band that owns it,
+    so merging the results drops numbers and gears seen in the halos.
+    """
+    bands = bands or os.cpu_count() or 1
+    offsets = line_offsets(data_file, bands)
+    starts, ends = offsets[:-1], offsets[1:]
+    paths = [data_file] * len(starts)
+    part_numbers, gear_ratios_by_gear = set(), {}
+    with ProcessPoolExecutor(max_workers) as executor:
+        line_counts = list(executor.map(_count_lines, paths, starts, ends))
+        first_ys = accumulate(line_counts[:-1], initial=0)
+        for band_part_numbers, band_gear_ratios_by_gear in executor.map(
+            _solve_band, paths, starts, ends, first_ys
+        ):
+            part_numbers |= band_part_numbers
+            gear_ratios_by_gear |= band_gear_ratios_by_gear
+
+    return part_numbers, gear_ratios_by_gear
+
+
+def _count_lines(data_file: Path, start: int, end: int) -> int:
+    count = 0
+    with open(data_file, "rb") as data:
+        data.seek(start)
+        while start < end:
+            chunk = data.read(min(CHUNK_SIZE, end - start))
+            count += chunk.count(b"\n")
+            start += len(chunk)
+
+    return count
+
+
+def _solve_band(
+    data_file: Path, start: int, end: int, first_y: int
+) -> tuple[set[Number], dict[Symbol, int]]:
+    with open(data_file, "rb") as data:
+        halo_above = _line_before(data, start)
+        data.seek(start)
+
+        def lines():
+            position = start
+            if halo_above:
+                yield halo_above.decode()
+            while position < end and (line := data.readline()):
+                position += len(line)
+                yield line.decode()
+            if halo_below := data.readline():
+                yield halo_below.decode()
+
+        rows = list(stream(lines(), first_y - 1 if halo_above else first_y))
+
+    if halo_above:
+        rows = rows[1:]
+    if end < os.path.getsize(data_file):
+        rows = rows[:-1]
+
+    part_numbers, gear_ratios_by_gear = set(), {}
+    for row_part_numbers, row_gear_ratios_by_gear in rows:
+        part_numbers |= row_part_numbers
+        gear_ratios_by_gear |= row_gear_ratios_by_gear
+
+    return part_numbers, gear_ratios_by_gear
+
+
+def _line_before(data: BinaryIO, offset: int) -> bytes:
+    start = offset - 1
+    while start > 0:
+        step = min(start, CHUNK_SIZE)
+        data.seek(start - step)
+        newline = data.read(step).rfind(b"\n")
+        start -= step
+        if newline >= 0:
+            start += newline + 1
+            break
+
+    data.seek(max(start, 0))
+    return data.read(offset - max(start, 0))
 
 
 def load(data_file: Path):
     symbols = set()
     numbers = set()
+    width = 0
     with open(data_file) as lines:
         for y, line in enumerate(lines):
             for symbol_match in re.finditer(r"(?![\d\\.]).", line.strip()):
@@ -165,9 +566,19 @@ def load(data_file: Path):
                 value = number_match.group()
                 numbers.add(Number(value=value, location=Coordinate(x, y)))
 
+            width = max(width, len(line.rstrip("\n")))
+
         extent = Extent(
             top_left=Coordinate(0, 0),
-            bottom_right=Coordinate(x=(len(line) - 1), y=y),
+            bottom_right=Coordinate(x=(width - 1), y=y),
         )
 
     return Schematic(extent=extent, symbols=symbols, numbers=numbers)
+
+
+def solution_1(schematic: Schematic) -> int:
+    return sum(map(int, (n.value for n in schematic.part_numbers)))
+
+
+def solution_2(schematic: Schematic) -> int:
+    return sum(schematic.gear_ratios_by_gear.values())
@@ -10,32 +10,60 @@ class ScratchCard:
     id: int
     winning_numbers: list[int] = field(default_factory=list)
     picks: list[int] = field(default_factory=list)
+    matches: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "matches",
+            (bitset(self.winning_numbers) & bitset(self.picks)).bit_count(),
+        )
 
     @cached_property
     def cards_won(self) -> list[int]:
-        return list(
-            range(
-                self.id + 1,
-                self.id + 1 + len(set(self.winning_numbers) & set(self.picks)),
-            )
-        )
+        return list(range(self.id + 1, self.id + 1 + self.matches))
 
     @cached_property
     def point_value(self):
-        winning_picks = set(self.winning_numbers) & set(self.picks)
-        return 0 if len(winning_picks) == 0 else 2 ** (len(winning_picks) - 1)
+        return 0 if self.matches == 0 else 2 ** (self.matches - 1)
+
+
+def bitset(numbers: list[int]) -> int:
+    """Pack small non-negative numbers into the bits of one integer."""
+    bits = 0
+    for n in numbers:
+        bits |= 1 << n
+
+    return bits
 
 
 def process(cards: list[ScratchCard]) -> Counter[int]:
-    cards_by_id = dict(map(lambda card: (card.id, card), cards))
-    card_counts = Counter(range(1, len(cards) + 1))
-    for i in range(1, len(cards) + 1):
-        current_card = cards_by_id[i]
-        card_counts.update(
-            dict(map(lambda id: (id, card_counts[i]), current_card.cards_won))
-        )
+    return Counter(dict(enumerate(card_counts(cards), start=1)))
+
 
-    return card_counts
+def card_counts(cards: list[ScratchCard]) -> list[int]:
+    """Count the copies of cards 1..n, cascading wins through a difference array.
+
+    Each card adds its count to the run of cards it wins by marking where the
+    run starts and ends, so the whole deck takes one pass. Wins past the last
+    card are dropped.
+    """
+    n = len(cards)
+    matches = [0] * (n + 1)
+    for card in cards:
+        matches[card.id] = card.matches
+
+    counts = [0] * n
+    difference = [0] * (n + 2)
+    extra = 0
+    for i in range(1, n + 1):
+        extra += difference[i]
+        counts[i - 1] = count = 1 + extra
+        if matches[i]:
+            difference[i + 1] += count
+            difference[min(i + matches[i], n) + 1] -= count
+
+    return counts
 
 
 def load(data_file: Path):
@@ -50,3 +78,11 @@ def load(data_file: Path):
             scratch_cards.append(ScratchCard(id, winning_numbers, picks))
 
     return scratch_cards
+
+
+def solution_1(cards: list[ScratchCard]) -> int:
+    return sum(card.point_value for card in cards)
+
+
+def solution_2(cards: list[ScratchCard]) -> int:
+    return sum(card_counts(cards))
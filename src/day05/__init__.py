@@ -1,9 +1,16 @@
+import os
 import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
+from functools import cached_property
 from itertools import chain
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import ClassVar, Self, TextIO
+
+CHUNK_SIZE = 2**16
 
 
 class Category(StrEnum):
@@ -17,27 +24,27 @@ class Category(StrEnum):
     LOCATION = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unit:
     category: Category
     id: int
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class Range:
         category: Category
         start: int
         length: int
+        end: int = field(init=False, repr=False, compare=False)
 
-        @property
-        def end(self):
-            return self.start + self.length
+        def __post_init__(self):
+            object.__setattr__(self, "end", self.start + self.length)
 
         @property
         def last(self):
             return self.end - 1
 
         def __contains__(self, item: int):
-            return item in range(self.start, self.end)
+            return self.start <= item < self.end
 
         def split(self, other):
             if not isinstance(other, Unit.Range):
@@ -94,6 +101,45 @@ class Almanac:
 
         return _next
 
+    def resolve_ranges(self, unit_ranges: Iterable[Unit.Range]) -> list[Unit.Range]:
+        _next = list(unit_ranges)
+        while _next and (category := _next[0].category) in self.maps:
+            _next = self.maps[category].map_ranges(_next)
+
+        return _next
+
+    def resolve_ids(self, ids, source: Category = Category.SEED):
+        """Resolve a NumPy array of ids through every map at once.
+
+        Returns the resolved ids and the position of the smallest one. Requires
+        the optional numpy dependency.
+        """
+        import numpy as np
+
+        _next = np.asarray(ids, dtype=np.int64)
+        category = source
+        while category in self.maps:
+            category_map = self.maps[category]
+            index = category_map.index
+            if index.starts:
+                starts = np.asarray(index.starts, dtype=np.int64)
+                ends = np.asarray(index.ends, dtype=np.int64)
+                offsets = np.asarray(index.offsets, dtype=np.int64)
+                i = np.searchsorted(starts, _next, side="right") - 1
+                clipped = np.maximum(i, 0)
+                inside = (i >= 0) & (_next < ends[clipped])
+                _next = _next + np.where(inside, offsets[clipped], 0)
+            category = category_map.destination
+
+        return _next, int(np.argmin(_next)) if len(_next) else None
+
+    def compose(self, source: Category = Category.SEED) -> "Almanac.Map":
+        composed = Almanac.Map(source, source, [])
+        while composed.destination in self.maps:
+            composed = composed.compose(self.maps[composed.destination])
+
+        return composed
+
     @dataclass
     class Map:
         source: Category
@@ -119,6 +165,83 @@ class Almanac:
                     *(int(number) for number in re.findall(r"\d+", data))
                 )
 
+        @dataclass(frozen=True)
+        class Index:
+            """Sorted, gap-free intervals [starts[i], ends[i]) with their offsets.
+
+            Lines are assumed not to overlap, as in every almanac. Gaps between
+            lines are filled with identity (zero-offset) intervals, and ids
+            outside the indexed span map to themselves.
+            """
+
+            starts: list[int]
+            ends: list[int]
+            offsets: list[int]
+
+            @staticmethod
+            def build(lines: list["Almanac.Map.Line"]) -> Self:
+                starts, ends, offsets = [], [], []
+                for line in sorted(lines, key=lambda l: l.source_range_start):
+                    if line.range_length == 0:
+                        continue
+                    start = line.source_range_start
+                    if ends and ends[-1] < start:
+                        starts.append(ends[-1])
+                        ends.append(start)
+                        offsets.append(0)
+                    starts.append(start)
+                    ends.append(start + line.range_length)
+                    offsets.append(line.destination_range_start - start)
+
+                return Almanac.Map.Index(starts, ends, offsets)
+
+            def offset(self, id: int) -> int:
+                i = bisect_right(self.starts, id) - 1
+                return self.offsets[i] if i >= 0 and id < self.ends[i] else 0
+
+        @cached_property
+        def index(self) -> "Almanac.Map.Index":
+            return Almanac.Map.Index.build(self.lines)
+
+        def compose(self, other: "Almanac.Map") -> "Almanac.Map":
+            """Merge this map and the next one into a single piecewise map."""
+            if not (other.source == self.destination):
+                raise KeyError(
+                    f"category '{other.source}' of map source does not match category '{self.destination}' of map destination"
+                )
+
+            first, second = self.index, other.index
+            second_breakpoints = sorted({*second.starts, *second.ends})
+            breakpoints = {*first.starts, *first.ends}
+            for start, end, offset in zip(first.starts, first.ends, first.offsets):
+                lo = bisect_right(second_breakpoints, start + offset)
+                hi = bisect_right(second_breakpoints, end + offset - 1)
+                breakpoints.update(b - offset for b in second_breakpoints[lo:hi])
+            span_start = first.starts[0] if first.starts else 0
+            span_end = first.ends[-1] if first.ends else 0
+            breakpoints.update(
+                b for b in second_breakpoints if not (span_start <= b < span_end)
+            )
+
+            lines = []
+            breakpoints = sorted(breakpoints)
+            for start, end in zip(breakpoints, breakpoints[1:]):
+                first_offset = first.offset(start)
+                offset = first_offset + second.offset(start + first_offset)
+                if offset == 0:
+                    continue
+                if lines and (
+                    (previous := lines[-1]).source_range_start + previous.range_length
+                    == start
+                    and previous.destination_range_start - previous.source_range_start
+                    == offset
+                ):
+                    previous.range_length += end - start
+                    continue
+                lines.append(Almanac.Map.Line(start + offset, start, end - start))
+
+            return Almanac.Map(self.source, other.destination, lines)
+
         def __getitem__(self, item):
             if not (item.category == self.source):
                 raise KeyError(
@@ -126,79 +249,180 @@ class Almanac:
                 )
 
             if isinstance(item, Unit):
-                source_unit = item
-                for line in self.lines:
-                    if source_unit.id in line.source_range:
-                        return Unit(
-                            category=self.destination,
-                            id=(
-                                source_unit.id
-                                - line.source_range_start
-                                + line.destination_range_start
-                            ),
-                        )
-
-                return Unit(category=self.destination, id=source_unit.id)
+                return Unit(
+                    category=self.destination,
+                    id=item.id + self.index.offset(item.id),
+                )
 
             if isinstance(item, Unit.Range):
-                destination_ranges = set()
-                remainders = {item}
-                for line in self.lines:
-                    line_source_range = Unit.Range(
-                        self.source, line.source_range_start, line.range_length
-                    )
-                    next_remainders = set()
-                    overlapped_remainders = set()
-                    for r in remainders:
-                        [overlap, *line_remainders] = r.split(line_source_range)
-                        if overlap is not None:
-                            overlapped_remainders.add(r)
-                            destination_ranges.add(
-                                Unit.Range(
-                                    category=self.destination,
-                                    start=(
-                                        overlap.start
-                                        - line.source_range_start
-                                        + line.destination_range_start
-                                    ),
-                                    length=overlap.length,
-                                )
-                            )
-
-                        next_remainders |= set(line_remainders)
-
-                    remainders |= next_remainders
-                    remainders -= overlapped_remainders
-
-                destination_ranges.update(
-                    map(
-                        lambda r: Unit.Range(self.destination, r.start, r.length),
-                        remainders,
+                if item.length == 0:
+                    start = item.start + self.index.offset(item.start)
+                    return {Unit.Range(self.destination, start, 0)}
+                return {
+                    Unit.Range(self.destination, start + offset, end - start)
+                    for start, end, offset in self.sweep([(item.start, item.end)])
+                }
+
+        def map_ranges(self, unit_ranges: Iterable[Unit.Range]) -> list[Unit.Range]:
+            """Map many ranges in one pass, coalescing adjacent output ranges."""
+            bounds = []
+            for r in sorted(unit_ranges, key=lambda r: r.start):
+                if not (r.category == self.source):
+                    raise KeyError(
+                        f"category '{r.category}' of item does not match category '{self.source}' of map source"
                     )
-                )
-
-                return destination_ranges
+                if bounds and r.start <= bounds[-1][1]:
+                    bounds[-1][1] = max(bounds[-1][1], r.end)
+                elif r.length > 0:
+                    bounds.append([r.start, r.end])
+
+            destination_ranges = []
+            for start, end in sorted(
+                (start + offset, end + offset)
+                for start, end, offset in self.sweep(bounds)
+            ):
+                if destination_ranges and start <= destination_ranges[-1][1]:
+                    destination_ranges[-1][1] = max(destination_ranges[-1][1], end)
+                else:
+                    destination_ranges.append([start, end])
+
+            return [
+                Unit.Range(self.destination, start, end - start)
+                for start, end in destination_ranges
+            ]
+
+        def sweep(self, bounds) -> Iterator[tuple[int, int, int]]:
+            """Split sorted, disjoint [start, end) bounds on the index intervals.
+
+            Yields (start, end, offset) for each piece. Each bound bisects to its
+            first interval, and the index is only walked forward from there.
+            """
+            index = self.index
+            starts, ends, offsets = index.starts, index.ends, index.offsets
+            i = 0
+            for start, end in bounds:
+                i = bisect_right(ends, start, i)
+                while start < end:
+                    if i == len(starts) or start < starts[i]:
+                        stop = end if i == len(starts) else min(end, starts[i])
+                        yield start, stop, 0
+                    else:
+                        stop = min(end, ends[i])
+                        yield start, stop, offsets[i]
+                        if stop == ends[i]:
+                            i += 1
+                    start = stop
+
+
+def lowest_location(
+    almanac: Almanac, seed_ranges: Iterable[Unit.Range], max_workers: int = None
+) -> int | None:
+    """Find the lowest location for many seed ranges across worker processes.
+
+    Each worker receives the almanac once, composes it, and returns only the
+    lowest location of each shard of seed ranges it resolves. Returns None
+    when the seed ranges are empty or cover no seeds at all.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    seed_ranges = [r for r in seed_ranges if r.length > 0]
+    if not seed_ranges:
+        return None
+    shard_size = max(1, -(-len(seed_ranges) // (max_workers * 4)))
+    shards = [
+        seed_ranges[i : i + shard_size] for i in range(0, len(seed_ranges), shard_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers, initializer=_init_worker, initargs=(almanac,)
+    ) as executor:
+        locations = executor.map(_lowest_location, shards)
+        return min((l for l in locations if l is not None), default=None)
+
+
+_composed_almanac: Almanac.Map = None
+
+
+def _init_worker(almanac: Almanac):
+    global _composed_almanac
+    _composed_almanac = almanac.compose()
+
+
+def _lowest_location(seed_ranges: list[Unit.Range]) -> int | None:
+    locations = _composed_almanac.map_ranges(seed_ranges)
+    return locations[0].start if locations else None
 
 
 def load(data_file: Path):
+    seed_numbers = list(stream_seed_numbers(data_file))
+    seeds = [Unit(Category.SEED, id=n) for n in seed_numbers]
+    seed_ranges = [
+        Unit.Range(Category.SEED, seed_numbers[n], seed_numbers[n + 1])
+        for n in range(0, len(seed_numbers), 2)
+    ]
+
+    return (seeds, seed_ranges, load_almanac(data_file))
+
+
+def solution_1(almanac_data: tuple[list[Unit], list[Unit.Range], Almanac]) -> int:
+    (seeds, _, almanac) = almanac_data
+    return min(almanac.resolve_unit(s).id for s in seeds)
+
+
+def solution_2(almanac_data: tuple[list[Unit], list[Unit.Range], Almanac]) -> int:
+    (_, seed_ranges, almanac) = almanac_data
+    return almanac.resolve_ranges(seed_ranges)[0].start
+
+
+def load_almanac(data_file: Path) -> Almanac:
+    """Load only the almanac maps, reading the file line by line."""
+    maps = {}
     with open(data_file) as data:
-        seed_data, *almanac_maps_data = re.split(r"\n\n+", data.read())
-        seed_numbers = [int(match) for match in re.findall(r"\d+", seed_data)]
-        seeds = [Unit(Category.SEED, id=n) for n in seed_numbers]
-        seed_ranges = [
-            Unit.Range(Category.SEED, seed_numbers[n], seed_numbers[n + 1])
-            for n in range(0, len(seed_numbers), 2)
-        ]
-
-        almanac_maps = []
-        for almanac_map_data in almanac_maps_data:
-            header, *lines_data = almanac_map_data.split("\n")
-            source, destination = map(
-                Category, re.match(r"(\w+)-to-(\w+) map:", header).groups()
-            )
-            lines = [Almanac.Map.Line.parse(line_data) for line_data in lines_data]
-            almanac_maps.append(Almanac.Map(source, destination, lines))
+        while (chunk := data.readline(CHUNK_SIZE)) and not chunk.endswith("\n"):
+            pass
+
+        for line in data:
+            if header := re.match(r"(\w+)-to-(\w+) map:", line):
+                source, destination = map(Category, header.groups())
+                maps[source] = Almanac.Map(source, destination, [])
+            elif line.strip():
+                maps[source].lines.append(Almanac.Map.Line.parse(line))
+
+    return Almanac(maps=maps)
 
-        almanac = Almanac(maps=dict((m.source, m) for m in almanac_maps))
 
-    return (seeds, seed_ranges, almanac)
+def stream_seeds(data_file: Path) -> Iterator[Unit]:
+    return (Unit(Category.SEED, id=n) for n in stream_seed_numbers(data_file))
+
+
+def stream_seed_ranges(data_file: Path) -> Iterator[Unit.Range]:
+    numbers = stream_seed_numbers(data_file)
+    return (
+        Unit.Range(Category.SEED, start, length)
+        for start, length in zip(numbers, numbers)
+    )
+
+
+def stream_seed_numbers(data_file: Path) -> Iterator[int]:
+    """Lazily parse the seeds line, holding at most one chunk of it at a time."""
+    with open(data_file) as data:
+        tokens = _stream_tokens(data)
+        if (label := next(tokens, "seeds:")) != "seeds:":
+            raise ValueError(f"expected 'seeds:' but found '{label}'")
+        for token in tokens:
+            if not token.isdigit():
+                raise ValueError(f"malformed seed number '{token}'")
+            yield int(token)
+
+
+def _stream_tokens(data: TextIO) -> Iterator[str]:
+    """Split the first line of `data` on whitespace, carrying tokens across chunks."""
+    pending = ""
+    while chunk := data.readline(CHUNK_SIZE):
+        text = pending + chunk
+        tokens = text.split()
+        pending = "" if text[-1].isspace() or not tokens else tokens.pop()
+        yield from tokens
+        if chunk.endswith("\n"):
+            return
+
+    if pending:
+        yield pending
@@ -1,4 +1,87 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from math import isqrt, prod
 from pathlib import Path
+from typing import Self
+
+
+@dataclass(frozen=True)
+class Race:
+    time: int
+    record: int
+
+    @cached_property
+    def ways_to_win(self) -> int:
+        """Count the hold times h for which h * (time - h) beats the record.
+
+        The winning hold times lie strictly between the roots of
+        h^2 - time * h + record = 0, which are found with an exact integer
+        square root, so arbitrarily large races never pass through floats.
+        """
+        discriminant = self.time**2 - 4 * self.record
+        if discriminant <= 0:
+            return 0
+
+        shortest = max((self.time - isqrt(discriminant)) // 2, 0)
+        while shortest > 0 and self.distance(shortest - 1) > self.record:
+            shortest -= 1
+        while shortest <= self.time // 2 and self.distance(shortest) <= self.record:
+            shortest += 1
+
+        return max(self.time - 2 * shortest + 1, 0)
+
+    def distance(self, hold_time: int) -> int:
+        return hold_time * (self.time - hold_time)
+
+    @staticmethod
+    def kerned(races: Iterable[Self]) -> Self:
+        """Read the races' numbers as one race, ignoring the spaces between them.
+
+        The numbers are concatenated arithmetically, since converting a long
+        kerned number through a string hits the int/str conversion limit.
+        """
+        time = record = 0
+        for r in races:
+            time = time * 10 ** decimal_digits(r.time) + r.time
+            record = record * 10 ** decimal_digits(r.record) + r.record
+
+        return Race(time, record)
+
+
+def decimal_digits(n: int) -> int:
+    """Count the decimal digits of a non-negative int without converting it to str."""
+    # 0.30102 < log10(2), so the estimate never overshoots.
+    digits = max(n.bit_length() * 30102 // 100000, 1)
+    while n >= 10**digits:
+        digits += 1
+
+    return digits
+
+
+def ways_to_win(races: Iterable[Race]) -> list[int]:
+    return [r.ways_to_win for r in races]
+
+
+def margin_of_error(races: Iterable[Race]) -> int:
+    return prod(ways_to_win(races))
+
+
+def solution_1(races: list[Race]) -> int:
+    return margin_of_error(races)
+
+
+def solution_2(races: list[Race]) -> int:
+    return Race.kerned(races).ways_to_win
+
 
 def load(data_file: Path):
-    pass
+    with open(data_file) as data:
+        numbers = [[int(n) for n in re.findall(r"\d+", line)] for line in data]
+
+    if not numbers:
+        return []
+
+    times, records = numbers[:2]
+    return [Race(time, record) for time, record in zip(times, records)]
@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.aoc.chunks import line_offsets
+from src.aoc.runner import Measurement, discover, run
+
+
+class RunnerTests(unittest.TestCase):
+    def test_discover(self):
+        self.assertEqual(
+            ["day01", "day02", "day03", "day04", "day05", "day06"], discover()
+        )
+
+    def test_run(self):
+        measurements = run(
+            "day02", Path(__file__).parent / "resources/day02/example.txt", repeat=2
+        )
+        self.assertEqual(
+            ["parse", "solution_1", "solution_2"], [m.stage for m in measurements]
+        )
+        self.assertEqual([None, 8, 2286], [m.answer for m in measurements])
+        self.assertTrue(all(len(m.wall) == 2 and len(m.cpu) == 2 for m in measurements))
+        self.assertTrue(all(m.peak > 0 for m in measurements))
+
+    def test_measurement_formats_huge_answers(self):
+        measurement = Measurement("solution_2", answer=2**20000, wall=[1], cpu=[1])
+        self.assertEqual("20001-bit int", measurement.formatted_answer)
+        self.assertIn("20001-bit int", str(measurement))
+
+
+class ChunksTests(unittest.TestCase):
+    def test_line_offsets(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "lines.txt"
+            path.write_bytes(b"aaaa\nbb\ncccccc\nd\n")
+            self.assertEqual([0, 5, 15, 17], line_offsets(path, 3))
+            self.assertEqual([0, 17], line_offsets(path, 1))
+            self.assertEqual([0, 5, 8, 15, 17], line_offsets(path, 100))
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.aoc.cache import cached_load, evict
+from src.day02 import load
+
+
+class CacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.data_file = self.cache_dir / "input.txt"
+        shutil.copy(
+            Path(__file__).parent / "resources/day02/example.txt", self.data_file
+        )
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def counting_load(self, data_file: Path):
+        self.calls += 1
+        return load(data_file)
+
+    def test_cached_load_skips_parsing_unchanged_input(self):
+        first = cached_load(
+            self.counting_load, self.data_file, cache_dir=self.cache_dir
+        )
+        second = cached_load(
+            self.counting_load, self.data_file, cache_dir=self.cache_dir
+        )
+        self.assertEqual(1, self.calls)
+        self.assertEqual(first, second)
+        self.assertEqual(load(self.data_file), second)
+
+    def test_cached_load_reparses_changed_input_or_version(self):
+        cached_load(self.counting_load, self.data_file, cache_dir=self.cache_dir)
+        cached_load(
+            self.counting_load, self.data_file, version="2", cache_dir=self.cache_dir
+        )
+        self.assertEqual(2, self.calls)
+
+        with open(self.data_file, "a") as data:
+            data.write("\nGame 6: 1 red\n")
+        games = cached_load(
+            self.counting_load, self.data_file, cache_dir=self.cache_dir
+        )
+        self.assertEqual(3, self.calls)
+        self.assertEqual(6, len(games))
+
+    def test_evict_least_recently_used(self):
+        for i, name in enumerate(["old", "used", "new"]):
+            entry = self.cache_dir / f"{name}.pickle"
+            entry.write_bytes(bytes(100))
+            os.utime(entry, (i, i))
+        os.utime(self.cache_dir / "used.pickle")
+
+        evict(self.cache_dir, max_bytes=200)
+        self.assertEqual(
+            ["new.pickle", "used.pickle"],
+            sorted(p.name for p in self.cache_dir.glob("*.pickle")),
+        )
@@ -0,0 +1,102 @@
+import json
+import pstats
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from src.aoc.profiling import HOT_PATHS, Profiler
+from src.aoc.runner import discover, main
+from src.day05 import Almanac, Unit, load, solution_1, solution_2
+from src.day06 import Race
+
+
+class ProfilerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_file = Path(__file__).parent / "resources/day05/example.txt"
+
+    def test_counts_hot_paths_only_while_entered(self):
+        original = vars(Almanac.Map)["__getitem__"]
+        with Profiler() as profiler:
+            self.assertIsNot(original, vars(Almanac.Map)["__getitem__"])
+            self.assertEqual(35, solution_1(load(self.data_file)))
+            self.assertEqual(Race(715, 940), Race.kerned([Race(7, 9), Race(15, 40)]))
+        self.assertIs(original, vars(Almanac.Map)["__getitem__"])
+
+        self.assertEqual(1, profiler.stats["src.day06:Race.kerned"].calls)
+        mapping = profiler.stats["src.day05:Almanac.Map.__getitem__"]
+        self.assertEqual(28, mapping.calls)
+        self.assertGreater(mapping.cumulative, 0)
+        self.assertEqual(0, profiler.stats["src.day04:card_counts"].calls)
+
+        Race.kerned([Race(7, 9)])
+        self.assertEqual(1, profiler.stats["src.day06:Race.kerned"].calls)
+
+    def test_times_generator_steps(self):
+        map_ranges, sweep = (
+            "src.day05:Almanac.Map.map_ranges",
+            "src.day05:Almanac.Map.sweep",
+        )
+        with Profiler((map_ranges, sweep)) as profiler:
+            self.assertEqual(46, solution_2(load(self.data_file)))
+
+        self.assertEqual(7, profiler.stats[map_ranges].calls)
+        self.assertEqual(7, profiler.stats[sweep].calls)
+        self.assertEqual({map_ranges: 7}, profiler.stats[sweep].callers)
+        self.assertGreater(profiler.stats[sweep].cumulative, 0)
+        self.assertLess(
+            profiler.stats[sweep].cumulative, profiler.stats[map_ranges].cumulative
+        )
+
+    def test_records_callers_and_inline_time(self):
+        _, _, almanac = load(self.data_file)
+        resolve, mapping = (
+            "src.day05:Almanac.resolve_unit",
+            "src.day05:Almanac.Map.__getitem__",
+        )
+        with Profiler((resolve, mapping)) as profiler:
+            self.assertEqual(
+                Unit("location", 82), almanac.resolve_unit(Unit("seed", 79))
+            )
+
+        self.assertEqual({resolve: 7}, profiler.stats[mapping].callers)
+        self.assertEqual({}, profiler.stats[resolve].callers)
+        outer = profiler.stats[resolve]
+        self.assertLess(outer.inline, outer.cumulative)
+        self.assertAlmostEqual(
+            outer.cumulative, outer.inline + profiler.stats[mapping].cumulative
+        )
+
+    def test_exports(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        with Profiler() as profiler:
+            solution_1(load(self.data_file))
+
+        exported = json.loads(profiler.to_json())
+        self.assertEqual(["src.day05:Almanac.Map.__getitem__"], list(exported))
+        self.assertEqual(28, exported["src.day05:Almanac.Map.__getitem__"]["calls"])
+        self.assertIn("retained_blocks", exported["src.day05:Almanac.Map.__getitem__"])
+
+        profiler.dump_stats(directory / "day05.prof")
+        stats = pstats.Stats(str(directory / "day05.prof"))
+        ((_, _, name),) = stats.stats
+        self.assertEqual("Almanac.Map.__getitem__", name)
+        self.assertEqual(28, stats.total_calls)
+
+    def test_runner_profiles_every_day(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        for day in discover():
+            profile = directory / f"{day}.json"
+            example = Path(__file__).parent / f"resources/{day}/example.txt"
+            with redirect_stdout(StringIO()):
+                main([day, "--input", str(example), "--profile", str(profile)])
+
+            counters = json.loads(profile.read_text())
+            self.assertTrue(counters, day)
+            self.assertTrue(all(t.startswith(f"src.{day}:") for t in counters), day)
+            self.assertTrue(set(counters) <= set(HOT_PATHS), day)
@@ -0,0 +1,38 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import measure
+from src.aoc.runner import run
+
+
+class GeneratorTests(unittest.TestCase):
+    def test_generators_are_deterministic(self):
+        for day, generate in GENERATORS.items():
+            self.assertEqual(generate(1), generate(1), day)
+            self.assertNotEqual(generate(1), generate(1, seed=2), day)
+
+    def test_generated_inputs_solve(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for day, generate in GENERATORS.items():
+                data_file = Path(directory) / f"{day}.txt"
+                data_file.write_text(generate(1))
+                answers = [m.answer for m in run(day, data_file)][1:]
+                self.assertTrue(all(isinstance(a, int) for a in answers), day)
+
+
+class SuiteTests(unittest.TestCase):
+    def test_measure_skips_targets_past_their_max_scale(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("benchmarks.suite.INPUTS", Path(directory)):
+                timings = measure("day05", 1, repeat=1)
+                self.assertGreater(timings["day05/x1/Almanac.resolve_range"], 0)
+                with patch.dict(
+                    "benchmarks.suite.MAX_SCALES", {"Almanac.resolve_range": 0}
+                ):
+                    timings = measure("day05", 1, repeat=1)
+
+        self.assertIsNone(timings["day05/x1/Almanac.resolve_range"])
+        self.assertGreater(timings["day05/x1/solution_2"], 0)
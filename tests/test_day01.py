@@ -1,7 +1,16 @@
+import tempfile
 import unittest
 from pathlib import Path
 
-from src.day01 import load, Strategy, parse_digits
+from src.day01 import (
+    load,
+    parallel_total,
+    scan,
+    total,
+    Strategy,
+    calibration_value,
+    parse_digits,
+)
 
 
 class Day01Tests(unittest.TestCase):
@@ -30,6 +39,44 @@ class Day01Tests(unittest.TestCase):
             parse_digits("12threeight\n", Strategy.DIGITS_OR_WORDS), [1, 2, 3, 8]
         )
 
+    def test_calibration_value(self):
+        self.assertEqual(18, calibration_value("1twone8\n", Strategy.DIGITS_ONLY))
+        self.assertEqual(21, calibration_value("xtwone\n", Strategy.DIGITS_OR_WORDS))
+        self.assertEqual(
+            88, calibration_value("eightwothree1oneight\n", Strategy.DIGITS_OR_WORDS)
+        )
+
+    def test_scan(self):
+        path = Path(__file__).parent / "resources/day01/example2.txt"
+        self.assertEqual(self.example_2, list(scan(path, Strategy.DIGITS_OR_WORDS)))
+
+    def test_total(self):
+        path = Path(__file__).parent / "../src/day01/input.txt"
+        self.assertEqual(55090, total(path))
+        self.assertEqual(54845, total(path, Strategy.DIGITS_OR_WORDS))
+
+    def test_parallel_total(self):
+        path = Path(__file__).parent / "../src/day01/input.txt"
+        for strategy, values in (
+            (Strategy.DIGITS_ONLY, self.input),
+            (Strategy.DIGITS_OR_WORDS, self.input_2),
+        ):
+            self.assertEqual(
+                sum(values), parallel_total(path, strategy, chunks=7, max_workers=2)
+            )
+
+    def test_line_without_digits(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "calibration.txt"
+            path.write_text("1abc2\n\nabc\n")
+            for strategy in Strategy:
+                with self.assertRaisesRegex(ValueError, "no calibration digit"):
+                    load(path, strategy)
+                with self.assertRaisesRegex(ValueError, "no calibration digit"):
+                    total(path, strategy)
+                with self.assertRaisesRegex(ValueError, "no calibration digit"):
+                    parallel_total(path, strategy, chunks=2, max_workers=2)
+
     def test_solution_1(self):
         self.assertEqual(sum(self.input), 55090)
 
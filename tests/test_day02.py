@@ -1,7 +1,18 @@
+import tempfile
 import unittest
+from importlib.util import find_spec
 from pathlib import Path
 
-from src.day02 import load, Drawing, Game, Bag
+from src.day02 import (
+    load,
+    load_columns,
+    scan,
+    scan_game,
+    BagIndex,
+    Drawing,
+    Game,
+    Bag,
+)
 
 
 class Day02Tests(unittest.TestCase):
@@ -33,6 +44,31 @@ class Day02Tests(unittest.TestCase):
             ],
         )
 
+    def test_scan_game(self):
+        game_data = "Game 12: 3 blue, 4 red; 1 red, 20 green, 6 blue; 2 green\n"
+        drawings = []
+        self.assertEqual(
+            (12, Bag(blue=6, green=20, red=4)), scan_game(game_data, drawings)
+        )
+        self.assertEqual(
+            [
+                Drawing(blue=3, red=4),
+                Drawing(red=1, green=20, blue=6),
+                Drawing(green=2),
+            ],
+            drawings,
+        )
+        self.assertEqual(
+            (12, Bag(blue=6, green=20, red=4)), scan_game(game_data.encode())
+        )
+        self.assertEqual((3, Bag(red=4)), scan_game(b"Game 3: 4 red\n"))
+
+    def test_scan(self):
+        self.assertEqual(
+            [(game.id, game.smallest_possible_bag) for game in self.input],
+            list(scan(Path(__file__).parent / "../src/day02/input.txt")),
+        )
+
     def test_game_is_possible_for_bag(self):
         bag = Bag(red=12, green=13, blue=14)
         self.assertEqual(
@@ -70,3 +106,74 @@ class Day02Tests(unittest.TestCase):
         self.assertEqual(
             67335, sum(game.smallest_possible_bag.power for game in self.input)
         )
+
+    def test_bag_index(self):
+        index = BagIndex.build(self.example)
+        self.assertEqual(
+            [8, 0, 15, 0, 5],
+            index.possible_id_sums(
+                [
+                    Bag(red=12, green=13, blue=14),
+                    Bag(),
+                    Bag(red=100, green=100, blue=100),
+                    Bag(red=-1, green=100, blue=100),
+                    Bag(red=6, green=3, blue=2),
+                ]
+            ),
+        )
+
+    def test_bag_index_large_counts(self):
+        index = BagIndex.build(
+            [Game.from_str("Game 1: 400 red, 400 green, 400 blue"), *self.example]
+        )
+        self.assertEqual([1, 4, 6, 14, 20, 400], index.reds)
+        self.assertEqual(16, index.possible_id_sum(Bag(red=400, green=400, blue=400)))
+        self.assertEqual(15, index.possible_id_sum(Bag(red=399, green=400, blue=400)))
+
+    def test_bag_index_sweep(self):
+        index = BagIndex.build(self.input)
+        bags = [
+            Bag(red=r, green=g, blue=b)
+            for r in range(0, 25, 3)
+            for g in range(0, 25, 4)
+            for b in range(0, 25, 5)
+        ]
+        self.assertEqual(
+            [
+                sum(game.id for game in self.input if game.is_possible(bag))
+                for bag in bags
+            ],
+            index.possible_id_sums(bags),
+        )
+        self.assertEqual(2512, index.possible_id_sum(Bag(red=12, green=13, blue=14)))
+
+    @unittest.skipUnless(find_spec("numpy"), "requires numpy")
+    def test_columns(self):
+        columns = load_columns(Path(__file__).parent / "resources/day02/example.txt")
+        bag = Bag(red=12, green=13, blue=14)
+        self.assertEqual(
+            [True, True, False, False, True], columns.is_possible(bag).tolist()
+        )
+        self.assertEqual(
+            [8, 0, 15], columns.possible_id_sums([bag, Bag(), Bag(20, 20, 20)]).tolist()
+        )
+        self.assertEqual(2286, columns.power_sum)
+
+    @unittest.skipUnless(find_spec("numpy"), "requires numpy")
+    def test_columns_empty(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "empty.txt"
+            path.write_text("")
+            columns = load_columns(path)
+
+        self.assertEqual([], columns.ids.tolist())
+        self.assertEqual([0], columns.possible_id_sums([Bag()]).tolist())
+        self.assertEqual(0, columns.power_sum)
+
+    @unittest.skipUnless(find_spec("numpy"), "requires numpy")
+    def test_columns_solutions(self):
+        columns = load_columns(Path(__file__).parent / "../src/day02/input.txt")
+        self.assertEqual(
+            [2512], columns.possible_id_sums([Bag(red=12, green=13, blue=14)]).tolist()
+        )
+        self.assertEqual(67335, columns.power_sum)
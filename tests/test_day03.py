@@ -1,7 +1,19 @@
+import tempfile
 import unittest
+from importlib.util import find_spec
 from pathlib import Path
 
-from src.day03 import load, Symbol, Coordinate, Number, Extent
+from src.day03 import (
+    load,
+    solve_parallel,
+    stream,
+    vectorized_file_sums,
+    vectorized_sums,
+    Symbol,
+    Coordinate,
+    Number,
+    Extent,
+)
 
 
 class Day03Tests(unittest.TestCase):
@@ -85,6 +97,44 @@ class Day03Tests(unittest.TestCase):
             {c for c in neighborhood},
         )
 
+    def test_extent_offsets(self):
+        extent = Extent(
+            top_left=Coordinate(x=1, y=2), bottom_right=Coordinate(x=3, y=3)
+        )
+        self.assertEqual([range(21, 24), range(31, 34)], list(extent.rows(10)))
+        self.assertEqual(
+            {c.y * 10 + c.x for c in extent},
+            set(extent.offsets(10)),
+        )
+        self.assertEqual(
+            [range(32, 35), range(42, 45)],
+            list(extent.rows(10, origin=Coordinate(x=-1, y=-1))),
+        )
+
+    def test_neighborhood_offsets(self):
+        neighborhood = Number("467", Coordinate(x=1, y=1)).extent.neighborhood
+        self.assertEqual(
+            [range(0, 5), range(10, 11), range(14, 15), range(20, 25)],
+            list(neighborhood.rows(10)),
+        )
+        self.assertEqual(
+            {c.y * 10 + c.x for c in neighborhood},
+            set(neighborhood.offsets(10)),
+        )
+
+    def test_part_numbers_by_extent_coordinates(self):
+        by_coordinates = self.example.part_numbers_by_extent_coordinates
+        self.assertEqual(
+            {c: n for n in self.example.part_numbers for c in n.extent},
+            by_coordinates,
+        )
+        self.assertEqual(
+            Number(value="467", location=Coordinate(x=0, y=0)),
+            by_coordinates[Coordinate(x=1, y=0)],
+        )
+        self.assertNotIn(Coordinate(x=3, y=0), by_coordinates)
+        self.assertNotIn(Coordinate(x=12, y=-1), by_coordinates)
+
     def test_schematic_part_numbers(self):
         self.assertEqual(8, len(self.example.part_numbers))
         self.assertEqual(
@@ -98,6 +148,36 @@ class Day03Tests(unittest.TestCase):
             4361, sum(map(int, (n.value for n in self.example.part_numbers)))
         )
 
+    def test_grid(self):
+        grid = self.example.grid
+        self.assertEqual(12, grid.width)
+        self.assertEqual(Coordinate(x=-1, y=-1), grid.origin)
+        self.assertEqual(1, grid.symbols[grid.offset(Coordinate(x=3, y=1))])
+        self.assertEqual(
+            Number(value="467", location=Coordinate(x=0, y=0)),
+            grid.numbers[grid.labels[grid.offset(Coordinate(x=2, y=0))]],
+        )
+        self.assertEqual(-1, grid.labels[grid.offset(Coordinate(x=3, y=0))])
+        self.assertEqual(
+            {
+                Number(value="467", location=Coordinate(x=0, y=0)),
+                Number(value="35", location=Coordinate(x=2, y=2)),
+            },
+            {grid.numbers[i] for i in grid.labels_around(Coordinate(x=3, y=1))},
+        )
+
+    def test_load_uneven_lines(self):
+        input_path = Path(__file__).parent / "../src/day03/input.txt"
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "input.txt"
+            path.write_text(input_path.read_text() + "\n\n")
+            self.assertEqual(self.input.part_numbers, load(path).part_numbers)
+
+            path.write_text("1.....*\n.......\n..\n")
+            schematic = load(path)
+            self.assertEqual(Coordinate(x=6, y=2), schematic.extent.bottom_right)
+            self.assertEqual(set(), schematic.part_numbers)
+
     def test_solution_1(self):
         self.assertEqual(
             525911, sum(map(int, (n.value for n in self.input.part_numbers)))
@@ -125,3 +205,41 @@ class Day03Tests(unittest.TestCase):
     def test_solution_2(self):
         print(self.input.gear_ratios_by_gear)
         self.assertEqual(75805607, sum(self.input.gear_ratios_by_gear.values()))
+
+    def test_stream(self):
+        with open(Path(__file__).parent / "../src/day03/input.txt") as lines:
+            part_numbers, gear_ratios_by_gear = set(), {}
+            for row_part_numbers, row_gear_ratios_by_gear in stream(lines):
+                part_numbers |= row_part_numbers
+                gear_ratios_by_gear |= row_gear_ratios_by_gear
+
+        self.assertEqual(self.input.part_numbers, part_numbers)
+        self.assertEqual(self.input.gear_ratios_by_gear, gear_ratios_by_gear)
+
+    def test_solve_parallel(self):
+        part_numbers, gear_ratios_by_gear = solve_parallel(
+            Path(__file__).parent / "../src/day03/input.txt", bands=7, max_workers=2
+        )
+        self.assertEqual(self.input.part_numbers, part_numbers)
+        self.assertEqual(self.input.gear_ratios_by_gear, gear_ratios_by_gear)
+
+    @unittest.skipUnless(find_spec("numpy"), "requires numpy")
+    def test_vectorized_sums(self):
+        with tempfile.TemporaryDirectory() as directory:
+            long = Path(directory) / "long.txt"
+            long.write_text(f"{'9' * 20}*{'8' * 19}\n..2.......\n")
+            ragged = Path(directory) / "ragged.txt"
+            ragged.write_text("12*\n3\n..4$5\n")
+            for path in (
+                Path(__file__).parent / "resources/day03/example.txt",
+                Path(__file__).parent / "../src/day03/input.txt",
+                long,
+                ragged,
+            ):
+                schematic = load(path)
+                sums = (
+                    sum(map(int, (n.value for n in schematic.part_numbers))),
+                    sum(schematic.gear_ratios_by_gear.values()),
+                )
+                self.assertEqual(sums, vectorized_sums(schematic), path.name)
+                self.assertEqual(sums, vectorized_file_sums(path), path.name)
@@ -2,7 +2,7 @@ import unittest
 from collections import Counter
 from pathlib import Path
 
-from src.day04 import load, process, ScratchCard
+from src.day04 import load, card_counts, process, ScratchCard
 
 
 class Day04Tests(unittest.TestCase):
@@ -22,6 +22,10 @@ class Day04Tests(unittest.TestCase):
         )
         self.assertEqual(6, len(self.example))
 
+    def test_matches(self):
+        self.assertEqual([4, 2, 2, 1, 0, 0], [card.matches for card in self.example])
+        self.assertEqual(2, ScratchCard(1, [5, 5, 70], [70, 5, 5, 6]).matches)
+
     def test_point_value(self):
         self.assertEqual(
             [8, 2, 2, 1, 0, 0], [card.point_value for card in self.example]
@@ -38,6 +42,9 @@ class Day04Tests(unittest.TestCase):
         self.assertEqual(Counter({1: 1, 2: 2, 3: 4, 4: 8, 5: 14, 6: 1}), card_counts)
         self.assertEqual(30, sum(card_counts.values()))
 
+    def test_card_counts(self):
+        self.assertEqual([1, 2, 4, 8, 14, 1], card_counts(self.example))
+
     def test_solution_2(self):
         card_counts = process(self.input)
         self.assertEqual(9924412, sum(card_counts.values()))
@@ -1,9 +1,22 @@
+import tempfile
 import unittest
+from importlib.util import find_spec
 from collections import Counter
 from itertools import chain
 from pathlib import Path
+from unittest.mock import patch
 
-from src.day05 import load, Unit, Category, Almanac
+from src.day05 import (
+    load,
+    load_almanac,
+    lowest_location,
+    stream_seeds,
+    stream_seed_numbers,
+    stream_seed_ranges,
+    Unit,
+    Category,
+    Almanac,
+)
 
 
 class Day05Tests(unittest.TestCase):
@@ -34,6 +47,27 @@ class Day05Tests(unittest.TestCase):
             [Almanac.Map.Line(50, 98, 2), Almanac.Map.Line(52, 50, 48)],
         )
 
+    def test_stream(self):
+        path = Path(__file__).parent / "resources/day05/example.txt"
+        self.assertEqual(self.example[0], list(stream_seeds(path)))
+        self.assertEqual(self.example[1], list(stream_seed_ranges(path)))
+        self.assertEqual(self.example[2], load_almanac(path))
+
+    def test_stream_seed_numbers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "seeds.txt"
+            for chunk_size in (3, 2**16):
+                with patch("src.day05.CHUNK_SIZE", chunk_size):
+                    path.write_text("seeds: 1 2  3 4\t5 66\n\nseed-to-soil map:\n")
+                    self.assertEqual(
+                        [1, 2, 3, 4, 5, 66], list(stream_seed_numbers(path))
+                    )
+                    path.write_text("seeds: 123 4567")
+                    self.assertEqual([123, 4567], list(stream_seed_numbers(path)))
+                    path.write_text("seeds: 1 2x 3\n")
+                    with self.assertRaises(ValueError):
+                        list(stream_seed_numbers(path))
+
     def test_almanac_map(self):
         lines = [Almanac.Map.Line(50, 98, 2), Almanac.Map.Line(52, 50, 48)]
 
@@ -48,6 +82,24 @@ class Day05Tests(unittest.TestCase):
         self.assertEqual(Unit(Category.SOIL, 57), almanac_map[Unit(Category.SEED, 55)])
         self.assertEqual(Unit(Category.SOIL, 13), almanac_map[Unit(Category.SEED, 13)])
 
+    def test_almanac_map_index(self):
+        almanac_map = Almanac.Map(
+            source=Category.SEED,
+            destination=Category.SOIL,
+            lines=[Almanac.Map.Line(50, 98, 2), Almanac.Map.Line(80, 10, 5)],
+        )
+
+        self.assertEqual(
+            Almanac.Map.Index(
+                starts=[10, 15, 98], ends=[15, 98, 100], offsets=[70, 0, -48]
+            ),
+            almanac_map.index,
+        )
+        self.assertEqual(
+            [0, 70, 70, 0, 0, -48, -48, 0],
+            [almanac_map.index.offset(i) for i in (9, 10, 14, 15, 97, 98, 99, 100)],
+        )
+
     def test_resolve_unit(self):
         (seeds, _, almanac) = self.example
         self.assertEqual(
@@ -67,6 +119,15 @@ class Day05Tests(unittest.TestCase):
             min([almanac.resolve_unit(s) for s in seeds], key=(lambda loc: loc.id)),
         )
 
+    @unittest.skipUnless(find_spec("numpy"), "requires numpy")
+    def test_resolve_ids(self):
+        (seeds, _, almanac) = self.input
+        locations, argmin = almanac.resolve_ids([s.id for s in seeds])
+        self.assertEqual(
+            [almanac.resolve_unit(s).id for s in seeds], locations.tolist()
+        )
+        self.assertEqual(196167384, locations[argmin])
+
     def test_split(self):
         first = Unit.Range(Category.SEED, 10, 10)
         second = Unit.Range(Category.SEED, 15, 20)
@@ -153,6 +214,89 @@ class Day05Tests(unittest.TestCase):
             location_ranges,
         )
 
+    def test_resolve_zero_length_range(self):
+        example = Path(__file__).parent / "resources/day05/example.txt"
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "input.txt"
+            path.write_text("seeds: 79 0\n" + example.read_text().split("\n", 1)[1])
+            (_, seed_ranges, almanac) = load(path)
+
+        self.assertEqual(
+            {Unit.Range(Category.LOCATION, 82, 0)},
+            almanac.resolve_range(seed_ranges[0]),
+        )
+
+    def test_map_ranges(self):
+        seed_to_soil_map = self.example[2].maps["seed"]
+
+        self.assertEqual(
+            [Unit.Range(Category.SOIL, 0, 100), Unit.Range(Category.SOIL, 120, 10)],
+            seed_to_soil_map.map_ranges(
+                [
+                    Unit.Range(Category.SEED, 120, 10),
+                    Unit.Range(Category.SEED, 40, 60),
+                    Unit.Range(Category.SEED, 0, 50),
+                ]
+            ),
+        )
+
+    def test_resolve_ranges(self):
+        (_, seed_ranges, almanac) = self.example
+        self.assertEqual(
+            [
+                Unit.Range(Category.LOCATION, 46, 15),
+                Unit.Range(Category.LOCATION, 82, 3),
+                Unit.Range(Category.LOCATION, 86, 4),
+                Unit.Range(Category.LOCATION, 94, 5),
+            ],
+            almanac.resolve_ranges(seed_ranges),
+        )
+
+    def test_resolve_ranges_solution(self):
+        (_, seed_ranges, almanac) = self.input
+        self.assertEqual(125742456, almanac.resolve_ranges(seed_ranges)[0].start)
+
+    def test_lowest_location(self):
+        (_, seed_ranges, almanac) = self.input
+        self.assertEqual(
+            125742456, lowest_location(almanac, seed_ranges, max_workers=2)
+        )
+
+    def test_lowest_location_empty(self):
+        (_, _, almanac) = self.example
+        self.assertIsNone(lowest_location(almanac, [], max_workers=1))
+        self.assertIsNone(
+            lowest_location(almanac, [Unit.Range(Category.SEED, 79, 0)], max_workers=1)
+        )
+        with patch("os.cpu_count", return_value=None):
+            self.assertEqual(
+                46, lowest_location(almanac, [Unit.Range(Category.SEED, 82, 1)])
+            )
+
+    def test_compose(self):
+        (seeds, seed_ranges, almanac) = self.example
+        composed = almanac.compose()
+
+        self.assertEqual(Category.SEED, composed.source)
+        self.assertEqual(Category.LOCATION, composed.destination)
+        self.assertEqual(
+            [almanac.resolve_unit(Unit(Category.SEED, id)) for id in range(110)],
+            [composed[Unit(Category.SEED, id)] for id in range(110)],
+        )
+        self.assertEqual(
+            46,
+            min(r.start for seed_range in seed_ranges for r in composed[seed_range]),
+        )
+
+    def test_compose_solutions(self):
+        (seeds, seed_ranges, almanac) = self.input
+        composed = almanac.compose()
+        self.assertEqual(196167384, min(composed[s].id for s in seeds))
+        self.assertEqual(
+            125742456,
+            min(r.start for seed_range in seed_ranges for r in composed[seed_range]),
+        )
+
     def test_solution_2(self):
         (_, seed_ranges, almanac) = self.input
         location_ranges = {
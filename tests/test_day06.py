@@ -1,9 +1,9 @@
+import sys
+import tempfile
 import unittest
-from collections import Counter
-from itertools import chain
 from pathlib import Path
 
-from src.day06 import load
+from src.day06 import Race, load, margin_of_error, solution_2, ways_to_win
 
 
 class Day06Tests(unittest.TestCase):
@@ -13,4 +13,45 @@ class Day06Tests(unittest.TestCase):
         cls.input = load(Path(__file__).parent / "../src/day06/input.txt")
 
     def test_load_example(self):
-        pass
\ No newline at end of file
+        self.assertEqual([Race(7, 9), Race(15, 40), Race(30, 200)], self.example)
+
+    def test_ways_to_win(self):
+        self.assertEqual([4, 8, 9], ways_to_win(self.example))
+        self.assertEqual(288, margin_of_error(self.example))
+
+    def test_ways_to_win_matches_every_hold_time(self):
+        for time in range(0, 40):
+            for record in range(-1, time**2 // 4 + 2):
+                race = Race(time, record)
+                self.assertEqual(
+                    sum(1 for h in range(time + 1) if race.distance(h) > record),
+                    race.ways_to_win,
+                    race,
+                )
+
+    def test_kerned(self):
+        race = Race.kerned(self.example)
+        self.assertEqual(Race(71530, 940200), race)
+        self.assertEqual(71503, race.ways_to_win)
+
+    def test_big_race(self):
+        self.assertEqual(1, Race(2 * 10**40, 10**80 - 1).ways_to_win)
+        self.assertEqual(0, Race(2 * 10**40, 10**80).ways_to_win)
+        self.assertEqual(3, Race(2 * 10**40, 10**80 - 4).ways_to_win)
+
+    def test_kerned_beyond_str_conversion_limit(self):
+        limit = sys.get_int_max_str_digits()
+        races = [Race(71530, 940200)] * (limit // 5 + 1)
+        race = Race.kerned(races)
+        self.assertEqual(race.time, Race.kerned([race]).time)
+        self.assertEqual(
+            sum(71530 * 10 ** (5 * i) for i in range(len(races))), race.time
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "input.txt"
+            path.write_text(
+                "Time: " + " ".join(["7", "15", "30"] * 1500) + "\n"
+                "Distance: " + " ".join(["9", "40", "200"] * 1500) + "\n"
+            )
+            self.assertGreater(solution_2(load(path)), 0)